@@ -2,4 +2,26 @@ from django.conf import settings
 from types import SimpleNamespace
 
 
-settings = SimpleNamespace(**settings.NOTION)
+settings = SimpleNamespace(
+    **{
+        'CONCURRENCY': 3,
+        'BATCH_SIZE': 25,
+        'RATE_LIMIT': 3,
+        'MAX_RETRIES': 5,
+        'USER_TTL': 60 * 60 * 24 * 7,
+        'WEBHOOK_SECRET': None,
+        'BASE_URL': 'https://api.notion.com',
+        'MEDIA_CONCURRENCY': 4,
+        'MEDIA_TIMEOUT': (10, 60),
+        'EXPORT_MODELS': (),
+        'MIN_INTERVAL': 60,
+        'MAX_INTERVAL': 60 * 60 * 6,
+        'INTERVALS': {},
+        'SWEEP_INTERVAL': 60 * 60 * 6,
+        'LOCK_TTL': 60,
+        'OUTBOX_ATTEMPTS': 5,
+        'OUTBOX_BACKOFF': 60,
+        'OUTBOX_CLAIM_TTL': 60 * 15,
+        **settings.NOTION
+    }
+)
@@ -0,0 +1,94 @@
+from django.contrib import admin
+from .jobs import flush_outbox, sync_database
+from .models import Database, Outbox
+
+
+@admin.register(Database)
+class DatabaseAdmin(admin.ModelAdmin):
+    list_display = (
+        'name',
+        'synced',
+        'scheduled',
+        'status',
+        'pages_seen',
+        'pages_written',
+        'api_calls'
+    )
+
+    readonly_fields = (
+        'name',
+        'last_edited',
+        'synced',
+        'swept',
+        'scheduled',
+        'cursor'
+    )
+    exclude = ('started', 'query')
+    actions = ('sync', 'full_sync')
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description='Status')
+    def status(self, obj):
+        return obj.get_progress().get('status', '-')
+
+    @admin.display(description='Pages seen')
+    def pages_seen(self, obj):
+        return obj.get_progress().get('pages_seen', '-')
+
+    @admin.display(description='Pages written')
+    def pages_written(self, obj):
+        return obj.get_progress().get('pages_written', '-')
+
+    @admin.display(description='API calls')
+    def api_calls(self, obj):
+        return obj.get_progress().get('api_calls', '-')
+
+    @admin.action(description='Sync selected databases')
+    def sync(self, request, queryset):
+        for database in queryset:
+            sync_database.delay(database.name)
+
+        self.message_user(
+            request,
+            'Queued %d database sync(s).' % queryset.count()
+        )
+
+    @admin.action(description='Fully re-sync selected databases')
+    def full_sync(self, request, queryset):
+        for database in queryset:
+            sync_database.delay(database.name, full=True)
+
+        self.message_user(
+            request,
+            'Queued %d full database sync(s).' % queryset.count()
+        )
+
+
+@admin.register(Outbox)
+class OutboxAdmin(admin.ModelAdmin):
+    list_display = ('content_object', 'content_type', 'queued', 'attempts')
+    readonly_fields = (
+        'content_type',
+        'object_id',
+        'queued',
+        'claimed',
+        'attempts',
+        'error'
+    )
+
+    actions = ('retry',)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description='Retry selected entries')
+    def retry(self, request, queryset):
+        count = queryset.update(attempts=0, claimed=None)
+        flush_outbox.delay()
+
+        self.message_user(
+            request,
+            'Queued %d outbox item(s) for retry.' % count
+        )
@@ -0,0 +1,225 @@
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.core.exceptions import FieldDoesNotExist
+from django.core.files.storage import default_storage
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from tempfile import SpooledTemporaryFile
+from . import settings
+from .helpers import batched
+from .models import Block, Database, Snapshot
+import io
+import json
+import tarfile
+
+
+BATCH_SIZE = 500
+
+CONTENT_MODELS = (
+    'notion.Blob',
+    '*',
+    'notion.Block',
+    'notion.Database',
+    'notion.Snapshot'
+)
+
+
+def has_field(Model, name):
+    try:
+        Model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+
+    return True
+
+
+def get_models():
+    for label in CONTENT_MODELS:
+        if label == '*':
+            for name in settings.EXPORT_MODELS:
+                yield apps.get_model(name)
+        else:
+            yield apps.get_model(label)
+
+
+def get_queryset(Model, content_models, content_types):
+    queryset = Model._default_manager.order_by('pk')
+
+    if Model is Database:
+        return queryset.filter(
+            notion_id__in=[
+                dbid for dbname, dbid in settings.DATABASES.items()
+                if apps.get_model(dbname) in content_models
+            ]
+        )
+
+    if Model is Snapshot:
+        exported = models.Q(
+            notion_id__in=Block.objects.filter(
+                content_type__in=content_types
+            ).values('notion_id')
+        )
+
+        for name in settings.EXPORT_MODELS:
+            ContentModel = apps.get_model(name)
+
+            if has_field(ContentModel, 'notion_id'):
+                exported |= models.Q(
+                    notion_id__in=ContentModel._default_manager.values(
+                        'notion_id'
+                    )
+                )
+
+        return queryset.filter(exported)
+
+    if has_field(Model, 'content_type'):
+        field = Model._meta.get_field('content_type')
+
+        if field.related_model is ContentType:
+            return queryset.filter(content_type__in=content_types)
+
+    return queryset
+
+
+def get_media(Model, queryset):
+    fields = [
+        field for field in Model._meta.fields
+        if isinstance(field, models.FileField)
+    ]
+
+    for obj in queryset.iterator():
+        for field in fields:
+            if name := getattr(obj, field.name).name:
+                yield name
+
+
+def add_member(archive, name, fileobj, size):
+    info = tarfile.TarInfo(name)
+    info.size = size
+    archive.addfile(info, fileobj)
+
+
+def export_content(fileobj, media=False):
+    content_models = list(get_models())
+    content_types = ContentType.objects.get_for_models(
+        *content_models
+    ).values()
+
+    serializer = serializers.get_serializer('jsonl')()
+
+    with tarfile.open(fileobj=fileobj, mode='w|gz') as archive:
+        for Model in content_models:
+            queryset = get_queryset(Model, content_models, content_types)
+
+            with SpooledTemporaryFile(max_size=1024 * 1024 * 8) as temp:
+                stream = io.TextIOWrapper(temp, encoding='utf-8')
+                serializer.serialize(
+                    queryset.iterator(),
+                    stream=stream,
+                    use_natural_foreign_keys=True
+                )
+
+                stream.detach()
+                size = temp.tell()
+                temp.seek(0)
+                add_member(
+                    archive,
+                    'content/%s.jsonl' % Model._meta.label_lower,
+                    temp,
+                    size
+                )
+
+            if not media:
+                continue
+
+            for name in get_media(Model, queryset):
+                if not default_storage.exists(name):
+                    continue
+
+                with default_storage.open(name, 'rb') as source:
+                    add_member(
+                        archive,
+                        'media/%s' % name,
+                        source,
+                        default_storage.size(name)
+                    )
+
+
+def load_objects(Model, lines, users):
+    user_fields = [
+        field.name for field in Model._meta.fields
+        if field.related_model is User
+    ]
+
+    objects = []
+
+    for line in lines:
+        data = json.loads(line)
+
+        if Model is Database:
+            data['fields']['cursor'] = ''
+
+        for name in user_fields:
+            if not data['fields'].get(name):
+                continue
+
+            username = data['fields'][name][0]
+            if username not in users:
+                users[username] = User.objects.filter(
+                    username=username
+                ).exists()
+
+            if not users[username]:
+                data['fields'][name] = None
+
+        objects.append(data)
+
+    return [
+        deserialized.object
+        for deserialized in serializers.deserialize('python', objects)
+    ]
+
+
+def import_content(fileobj):
+    content_models = list(get_models())
+    users = {}
+
+    with transaction.atomic():
+        for Model in content_models:
+            if Model._default_manager.exists():
+                raise Exception(
+                    '%s already has content' % Model._meta.label
+                )
+
+        with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+            for member in archive:
+                source = archive.extractfile(member)
+
+                if source is None:
+                    continue
+
+                if member.name.startswith('media/'):
+                    name = member.name[len('media/'):]
+
+                    if not default_storage.exists(name):
+                        default_storage.save(name, source)
+
+                    continue
+
+                Model = apps.get_model(
+                    member.name[len('content/'):-len('.jsonl')]
+                )
+
+                for lines in batched(source, BATCH_SIZE):
+                    Model._default_manager.bulk_create(
+                        load_objects(Model, lines, users)
+                    )
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(),
+                content_models
+            ):
+                cursor.execute(sql)
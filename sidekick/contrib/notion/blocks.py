@@ -1,11 +1,48 @@
 from django.apps import apps
-from notion_client import Client
+from hashlib import sha256
+from notion_client.helpers import iterate_paginated_api
+from urllib.parse import urlsplit
 from uuid import UUID
 from . import settings
+from .client import get_client
+import json
 import re
 
 
 NOTION_PATH_MATCH = re.compile(r'^/([a-zA-Z0-9]{32})$')
+VOLATILE_KEYS = ('expiry_time', 'last_edited_by', 'last_edited_time')
+
+
+def normalise(value):
+    if isinstance(value, dict):
+        returned = {
+            key: normalise(item)
+            for key, item in value.items()
+            if key not in VOLATILE_KEYS
+        }
+
+        if isinstance(file := returned.get('file'), dict) and 'url' in file:
+            file['url'] = urlsplit(file['url'])._replace(query='').geturl()
+
+        return returned
+
+    if isinstance(value, list):
+        return [normalise(item) for item in value]
+
+    return value
+
+
+def find_urls(value):
+    if isinstance(value, dict):
+        if isinstance(link := value.get('link'), dict) and 'url' in link:
+            yield link['url']
+
+        for item in value.values():
+            yield from find_urls(item)
+
+    if isinstance(value, list):
+        for item in value:
+            yield from find_urls(item)
 
 
 class BlockBase(object):
@@ -19,24 +56,65 @@ class BlockBase(object):
 
     def get_children(self):
         if self._definition['has_children']:
-            notion = Client(auth=settings.API_KEY)
-            response = notion.blocks.children.list(
-                self._definition['id']
-            )
+            if 'children' in self._definition:
+                results = self._definition['children']
+            else:
+                results = iterate_blocks(
+                    get_client(),
+                    self._definition['id']
+                )
 
             kwargs = {
-                'handle_media': getattr(self, 'handle_media', None)
+                'handle_media': getattr(self, 'handle_media', None),
+                'handle_link': getattr(self, 'handle_link', None)
             }
 
-            for result in response.get('results', []):
+            for result in results:
                 yield Block(result, **kwargs)
 
     def handle_media(self, url):
         raise NotImplementedError
 
+    def get_media(self):
+        urls = []
+
+        for child in self.get_children():
+            urls.extend(child.get_media())
+
+        return urls
+
+    def get_links(self):
+        return [
+            self.parse_url(url)
+            for url in find_urls(self._definition)
+            if NOTION_PATH_MATCH.match(url)
+        ]
+
+    def has_unresolved_links(self):
+        return any(NOTION_PATH_MATCH.match(url) for url in self.get_links())
+
+    def get_hash(self):
+        value = normalise(self._definition)
+
+        if links := self.get_links():
+            value = [value, links]
+
+        return sha256(
+            json.dumps(value, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+
     def to_python(self):
         raise NotImplementedError
 
+    def handle_link(self, notion_id):
+        for dbname, dbid in settings.DATABASES.items():
+            Model = apps.get_model(dbname)
+
+            for obj in Model.objects.filter(
+                notion_id=notion_id
+            ):
+                return obj.get_absolute_url()
+
     def parse_url(self, url):
         if match := NOTION_PATH_MATCH.match(url):
             try:
@@ -44,13 +122,7 @@ class BlockBase(object):
             except ValueError:
                 return url
 
-            for dbname, dbid in settings.DATABASES.items():
-                Model = apps.get_model(dbname)
-
-                for obj in Model.objects.filter(
-                    notion_id=notion_id
-                ):
-                    return obj.get_absolute_url()
+            return self.handle_link(notion_id) or url
 
         return url
 
@@ -114,6 +186,9 @@ class Heading3Block(RichTextBlock):
 
 
 class ImageBlock(BlockBase):
+    def get_media(self):
+        return [self.value['file']['url']]
+
     def to_python(self):
         return {
             'alt': self.value['caption'],
@@ -163,6 +238,12 @@ class CalloutBlock(RichTextBlock):
 
 
 class VideoBlock(BlockBase):
+    def get_media(self):
+        if self.value['type'] == 'external':
+            return []
+
+        return [self.value['file']['url']]
+
     def to_python(self):
         if self.value['type'] == 'external':
             path = self.value['external']['url']
@@ -182,7 +263,14 @@ class DividerBlock(BlockBase):
         return {}
 
 
-def Block(definition, handle_media=None):
+def iterate_blocks(notion, block_id):
+    return iterate_paginated_api(
+        notion.blocks.children.list,
+        block_id=block_id
+    )
+
+
+def Block(definition, handle_media=None, handle_link=None):
     block_type = definition['type']
 
     try:
@@ -205,6 +293,9 @@ def Block(definition, handle_media=None):
     if handle_media is not None:
         handlers['media'] = handle_media
 
+    if handle_link is not None:
+        handlers['link'] = handle_link
+
     return Block(
         definition,
         handlers=handlers
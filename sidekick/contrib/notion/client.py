@@ -0,0 +1,55 @@
+from functools import lru_cache
+from . import settings
+from .ratelimit import limiter
+import asyncio
+import notion_client
+import time
+
+
+def is_idempotent(path, method):
+    return not (method.upper() == 'POST' and path.strip('/') == 'pages')
+
+
+class Client(notion_client.Client):
+    def request(self, path, method, *args, **kwargs):
+        idempotent = is_idempotent(path, method)
+        attempt = 0
+
+        while True:
+            limiter.wait()
+
+            try:
+                return super().request(path, method, *args, **kwargs)
+            except Exception as ex:
+                delay = limiter.get_retry_delay(ex, attempt, idempotent)
+
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+
+class AsyncClient(notion_client.AsyncClient):
+    async def request(self, path, method, *args, **kwargs):
+        idempotent = is_idempotent(path, method)
+        attempt = 0
+
+        while True:
+            await limiter.async_wait()
+
+            try:
+                return await super().request(path, method, *args, **kwargs)
+            except Exception as ex:
+                delay = limiter.get_retry_delay(ex, attempt, idempotent)
+
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    return Client(auth=settings.API_KEY, base_url=settings.BASE_URL)
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from notion_client.helpers import (
+    async_collect_paginated_api,
+    collect_paginated_api
+)
+
+from . import settings
+from .client import AsyncClient, get_client
+import asyncio
+
+
+def get_parents(blocks):
+    return [
+        block for block in blocks
+        if block['has_children'] and 'children' not in block
+    ]
+
+
+def resolve_children(blocks, concurrency=None, notion=None):
+    notion = notion or get_client()
+    level = get_parents(blocks)
+
+    def get_children(block):
+        return collect_paginated_api(
+            notion.blocks.children.list,
+            block_id=block['id']
+        )
+
+    with ThreadPoolExecutor(concurrency or settings.CONCURRENCY) as pool:
+        while level:
+            children = list(pool.map(get_children, level))
+
+            for block, results in zip(level, children):
+                block['children'] = results
+
+            level = get_parents(chain(*children))
+
+    return blocks
+
+
+async def get_children(notion, semaphore, block_id):
+    async with semaphore:
+        return await async_collect_paginated_api(
+            notion.blocks.children.list,
+            block_id=block_id
+        )
+
+
+async def get_trees(page_ids, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    notion = AsyncClient(auth=settings.API_KEY, base_url=settings.BASE_URL)
+
+    try:
+        trees = await asyncio.gather(
+            *[
+                get_children(notion, semaphore, page_id)
+                for page_id in page_ids
+            ]
+        )
+
+        level = get_parents(chain(*trees))
+        while level:
+            children = await asyncio.gather(
+                *[
+                    get_children(notion, semaphore, block['id'])
+                    for block in level
+                ]
+            )
+
+            for block, results in zip(level, children):
+                block['children'] = results
+
+            level = get_parents(chain(*children))
+    finally:
+        await notion.aclose()
+
+    return dict(zip(page_ids, trees))
+
+
+def fetch_blocks(page_ids, concurrency=None):
+    if not page_ids:
+        return {}
+
+    return asyncio.run(
+        get_trees(
+            page_ids,
+            concurrency or settings.CONCURRENCY
+        )
+    )
@@ -1,5 +1,10 @@
+from django.conf import settings
+from functools import lru_cache
+from redis import Redis
 from tempfile import NamedTemporaryFile
 import ffmpeg
+import json
+import zlib
 
 
 def create_poster(src):
@@ -13,3 +18,32 @@ def create_poster(src):
         ).overwrite_output().run()
 
     return dest.name
+
+
+def batched(iterable, size):
+    batch = []
+
+    for item in iterable:
+        batch.append(item)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+@lru_cache(maxsize=None)
+def get_redis():
+    return Redis.from_url(settings.REDIS_URL)
+
+
+def compress(value):
+    return zlib.compress(
+        json.dumps(value, separators=(',', ':')).encode('utf-8')
+    )
+
+
+def decompress(data):
+    return json.loads(zlib.decompress(data))
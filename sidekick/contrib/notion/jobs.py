@@ -0,0 +1,192 @@
+from django.apps import apps
+from django.db import transaction
+from django.utils import timezone
+from django_rq import get_queue, job
+from notion_client import APIErrorCode, APIResponseError
+from uuid import uuid4
+from . import settings
+from .client import get_client
+from .helpers import get_redis
+from .models import Database, Outbox
+from .progress import Progress
+from .sync import delete_objects, from_model, in_database
+
+
+@job('default')
+def sync_page(page_id):
+    try:
+        page = get_client().pages.retrieve(page_id)
+    except APIResponseError as ex:
+        if ex.code != APIErrorCode.ObjectNotFound:
+            raise
+
+        for dbname, dbid in settings.DATABASES.items():
+            Model = apps.get_model(dbname)
+            delete_objects(Model.objects.filter(notion_id=page_id))
+
+        return
+
+    for dbname, dbid in settings.DATABASES.items():
+        if in_database(page, dbid):
+            Model = apps.get_model(dbname)
+            Model.objects.sync(pages=[page])
+
+
+@job('default', timeout=60 * 60 * 3)
+def sync_database(dbname, full=False, incremental=False):
+    Model = apps.get_model(dbname)
+
+    try:
+        Model.objects.sync(full=full, incremental=incremental)
+    except Exception as ex:
+        Progress(settings.DATABASES[dbname]).fail(ex)
+        raise
+
+
+def get_interval(dbname, database):
+    low, high = settings.INTERVALS.get(
+        dbname,
+        (settings.MIN_INTERVAL, settings.MAX_INTERVAL)
+    )
+
+    if database is None or database.last_edited is None:
+        return low
+
+    idle = (timezone.now() - database.last_edited).total_seconds()
+    return int(min(max(idle / 4, low), high))
+
+
+def is_swept(database):
+    if database is None or database.swept is None:
+        return False
+
+    elapsed = (timezone.now() - database.swept).total_seconds()
+    return elapsed < settings.SWEEP_INTERVAL
+
+
+def enqueue_sync(dbname, token, interval):
+    Database.objects.filter(
+        notion_id=settings.DATABASES[dbname]
+    ).update(
+        scheduled=timezone.now() + timezone.timedelta(seconds=interval)
+    )
+
+    get_queue('default').enqueue_in(
+        timezone.timedelta(seconds=interval),
+        scheduled_sync,
+        dbname,
+        token
+    )
+
+
+def schedule_sync(dbname):
+    token = uuid4().hex
+    get_redis().set('notion:schedule:%s' % dbname, token)
+    enqueue_sync(dbname, token, 0)
+
+
+def is_scheduled(dbname, token):
+    current = get_redis().get('notion:schedule:%s' % dbname)
+    return current is not None and current.decode('utf-8') == token
+
+
+@job('default', timeout=60 * 60 * 3)
+def scheduled_sync(dbname, token):
+    if not is_scheduled(dbname, token):
+        return
+
+    database = Database.objects.filter(
+        notion_id=settings.DATABASES[dbname]
+    ).first()
+
+    try:
+        sync_database(dbname, incremental=is_swept(database))
+    finally:
+        if is_scheduled(dbname, token):
+            database = Database.objects.filter(
+                notion_id=settings.DATABASES[dbname]
+            ).first()
+
+            enqueue_sync(dbname, token, get_interval(dbname, database))
+
+
+def claim(pk):
+    expired = timezone.now() - timezone.timedelta(
+        seconds=settings.OUTBOX_CLAIM_TTL
+    )
+
+    with transaction.atomic():
+        entry = Outbox.objects.select_for_update(
+            skip_locked=True
+        ).filter(
+            pk=pk,
+            attempts__lt=settings.OUTBOX_ATTEMPTS
+        ).first()
+
+        if entry is None or (
+            entry.claimed is not None and entry.claimed > expired
+        ):
+            return None
+
+        entry.claimed = timezone.now()
+        entry.save(update_fields=('claimed',))
+
+    return entry
+
+
+@job('default')
+def flush_outbox():
+    retries = []
+    requeued = False
+
+    for pk in Outbox.objects.filter(
+        attempts__lt=settings.OUTBOX_ATTEMPTS
+    ).values_list('pk', flat=True):
+        entry = claim(pk)
+
+        if entry is None:
+            continue
+
+        obj = entry.content_object
+        if obj is None:
+            entry.delete()
+            continue
+
+        try:
+            notion_id = from_model(obj)
+        except Exception as ex:
+            Outbox.objects.filter(pk=pk).update(
+                claimed=None,
+                attempts=entry.attempts + 1,
+                error=str(ex)
+            )
+
+            if entry.attempts + 1 < settings.OUTBOX_ATTEMPTS:
+                retries.append(entry.attempts + 1)
+
+            continue
+
+        if not obj.notion_id:
+            obj._meta.model.objects.filter(pk=obj.pk).update(
+                notion_id=notion_id
+            )
+
+        deleted, counts = Outbox.objects.filter(
+            pk=pk,
+            queued=entry.queued
+        ).delete()
+
+        if not deleted:
+            Outbox.objects.filter(pk=pk).update(claimed=None)
+            requeued = True
+
+    if requeued:
+        flush_outbox.delay()
+
+    if retries:
+        get_queue('default').enqueue_in(
+            timezone.timedelta(
+                seconds=settings.OUTBOX_BACKOFF * 2 ** (min(retries) - 1)
+            ),
+            flush_outbox
+        )
@@ -0,0 +1,32 @@
+from django.apps import apps
+from . import settings
+
+
+class LinkIndex(object):
+    def __init__(self):
+        self.urls = None
+
+    def load(self):
+        self.urls = {}
+
+        for dbname, dbid in settings.DATABASES.items():
+            Model = apps.get_model(dbname)
+
+            if not hasattr(Model, 'get_absolute_url'):
+                continue
+
+            for obj in Model.objects.exclude(notion_id=None).iterator():
+                self.urls[obj.notion_id] = obj.get_absolute_url()
+
+    def get(self, notion_id):
+        if self.urls is None:
+            self.load()
+
+        return self.urls.get(notion_id)
+
+    def add(self, obj):
+        if self.urls is None:
+            self.load()
+
+        if obj.notion_id and hasattr(obj, 'get_absolute_url'):
+            self.urls[obj.notion_id] = obj.get_absolute_url()
@@ -0,0 +1,65 @@
+from redis.exceptions import LockError, RedisError
+from threading import Event, Thread
+from uuid import UUID
+from . import settings
+from .helpers import get_redis
+import logging
+
+
+class Lease(object):
+    def __init__(self, dbid):
+        self.key = 'notion:lock:%s' % UUID(str(dbid))
+        self.lock = None
+        self.thread = None
+        self.lost = False
+        self.stopped = Event()
+
+    def acquire(self):
+        lock = get_redis().lock(
+            self.key,
+            timeout=settings.LOCK_TTL,
+            blocking=False,
+            thread_local=False
+        )
+
+        try:
+            if not lock.acquire():
+                return False
+        except RedisError:
+            logging.warning('Notion sync lock unavailable', exc_info=True)
+            return True
+
+        self.lock = lock
+        self.thread = Thread(target=self.heartbeat, daemon=True)
+        self.thread.start()
+        return True
+
+    def heartbeat(self):
+        while not self.stopped.wait(settings.LOCK_TTL / 3):
+            try:
+                self.lock.reacquire()
+            except LockError:
+                self.lost = True
+                return
+            except RedisError:
+                logging.warning('Notion sync lock unavailable', exc_info=True)
+
+    def check(self):
+        if self.lost:
+            raise Exception('Lost the Notion sync lock for %s' % self.key)
+
+    def release(self):
+        self.stopped.set()
+
+        if self.thread is not None:
+            self.thread.join()
+
+        if self.lock is None:
+            return
+
+        try:
+            self.lock.release()
+        except LockError:
+            pass
+        except RedisError:
+            logging.warning('Notion sync lock unavailable', exc_info=True)
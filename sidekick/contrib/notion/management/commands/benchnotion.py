@@ -0,0 +1,210 @@
+from django.apps import apps
+from django.conf import settings as django_settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from redis.exceptions import RedisError
+from sidekick.contrib.notion import settings
+from sidekick.contrib.notion.client import get_client
+from sidekick.contrib.notion.helpers import get_redis
+from sidekick.contrib.notion.progress import Progress
+from sidekick.contrib.notion.ratelimit import limiter
+from sidekick.contrib.notion.server import FakeNotion, USER_EMAIL
+from uuid import uuid4
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+
+class Command(BaseCommand):
+    help = 'Benchmark syncing against a local stand-in for the Notion API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=100,
+            help='Number of pages in each fake database.'
+        )
+
+        parser.add_argument(
+            '--blocks',
+            type=int,
+            default=50,
+            help='Number of top-level blocks in each fake page.'
+        )
+
+        parser.add_argument(
+            '--media-size',
+            type=int,
+            default=4096,
+            help='Size in bytes of each fake media file.'
+        )
+
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0,
+            help='Seconds the fake API waits before each response.'
+        )
+
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=1000,
+            help='Requests per second allowed by the rate limiter.'
+        )
+
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Number of block requests to run at once.'
+        )
+
+    def measure(self, label, func, fake):
+        queries = [0]
+
+        def count_query(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        requests = limiter.requests
+        fake_requests = fake.requests
+
+        tracemalloc.start()
+        started = time.perf_counter()
+
+        with connection.execute_wrapper(count_query):
+            func()
+
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        api_calls = limiter.requests - requests
+        self.stdout.write(
+            '%-14s %9.2fs %9d queries %7d API calls %6d media %9.1f MB' % (
+                label,
+                elapsed,
+                queries[0],
+                api_calls,
+                fake.requests - fake_requests - api_calls,
+                peak / 1024 / 1024
+            )
+        )
+
+    def sync(self, full, concurrency):
+        for dbname in settings.DATABASES:
+            apps.get_model(dbname).objects.sync(
+                full=full,
+                concurrency=concurrency
+            )
+
+    def handle(self, *args, **options):
+        fake = FakeNotion(
+            settings.DATABASES,
+            pages=options['pages'],
+            blocks=options['blocks'],
+            media_size=options['media_size'],
+            latency=options['latency']
+        )
+
+        defaults = (
+            settings.API_KEY,
+            settings.BASE_URL,
+            settings.DATABASES,
+            limiter.key,
+            limiter.rate
+        )
+
+        old_name = connection.settings_dict['NAME']
+        media_root = tempfile.mkdtemp()
+        concurrency = options['concurrency']
+
+        fake.start()
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+        try:
+            settings.API_KEY = 'benchmark'
+            settings.BASE_URL = fake.base_url
+            settings.DATABASES = {
+                dbname: fake.get_dbid(apps.get_model(dbname))
+                for dbname in settings.DATABASES
+            }
+
+            limiter.key = 'notion:benchmark:%s' % uuid4().hex
+            limiter.rate = options['rate']
+            get_client.cache_clear()
+            User.objects.create(username='notion', email=USER_EMAIL)
+
+            self.stdout.write(
+                '%d pages x %d blocks in %d databases' % (
+                    options['pages'],
+                    options['blocks'],
+                    len(settings.DATABASES)
+                )
+            )
+
+            with override_settings(
+                MEDIA_ROOT=media_root,
+                STORAGES={
+                    **django_settings.STORAGES,
+                    'default': {
+                        'BACKEND': 'django.core.files.storage.FileSystemStorage',  # NOQA
+                        'OPTIONS': {
+                            'location': media_root
+                        }
+                    }
+                }
+            ):
+                self.measure(
+                    'Initial sync',
+                    lambda: self.sync(False, concurrency),
+                    fake
+                )
+
+                self.measure(
+                    'No-op sync',
+                    lambda: self.sync(False, concurrency),
+                    fake
+                )
+
+                fake.edited = '2024-01-02T00:00:00.000Z'
+                self.measure(
+                    'Touched sync',
+                    lambda: self.sync(False, concurrency),
+                    fake
+                )
+
+                self.measure(
+                    'Full sync',
+                    lambda: self.sync(True, concurrency),
+                    fake
+                )
+        finally:
+            try:
+                get_redis().delete(
+                    limiter.key,
+                    '%s:counters' % limiter.key,
+                    *[
+                        Progress(dbid).key
+                        for dbid in settings.DATABASES.values()
+                    ]
+                )
+            except RedisError:
+                pass
+
+            (
+                settings.API_KEY,
+                settings.BASE_URL,
+                settings.DATABASES,
+                limiter.key,
+                limiter.rate
+            ) = defaults
+
+            get_client.cache_clear()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            fake.stop()
+            shutil.rmtree(media_root, ignore_errors=True)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from sidekick.contrib.notion.archive import export_content
+import sys
+
+
+class Command(BaseCommand):
+    help = 'Write synced content to a compressed archive.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Archive to write, or - for standard output.'
+        )
+
+        parser.add_argument(
+            '--media',
+            action='store_true',
+            help='Include media files referenced by the content.'
+        )
+
+    def handle(self, *args, **options):
+        if options['path'] == '-':
+            export_content(sys.stdout.buffer, media=options['media'])
+            return
+
+        with open(options['path'], 'wb') as fileobj:
+            export_content(fileobj, media=options['media'])
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+from sidekick.contrib.notion.archive import import_content
+import sys
+
+
+class Command(BaseCommand):
+    help = 'Load synced content from an archive written by exportcontent.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Archive to read, or - for standard input.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options['path'] == '-':
+                import_content(sys.stdin.buffer)
+            else:
+                with open(options['path'], 'rb') as fileobj:
+                    import_content(fileobj)
+        except Exception as ex:
+            raise CommandError(str(ex)) from ex
@@ -1,12 +1,132 @@
 from django.apps import apps
 from django.core.management.base import BaseCommand
 from sidekick.contrib.notion import settings
+from sidekick.contrib.notion.jobs import schedule_sync, sync_database
+from sidekick.contrib.notion.plan import plan
 
 
 class Command(BaseCommand):
     help = 'Sync models with Notion databases.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Re-sync every page and block, even those left unchanged.'
+        )
+
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only query pages edited since last run, skipping deletions.'
+        )
+
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Number of block requests to run at once.'
+        )
+
+        parser.add_argument(
+            '--enqueue',
+            action='store_true',
+            help='Run each database sync as a background job.'
+        )
+
+        parser.add_argument(
+            '--schedule',
+            action='store_true',
+            help='Keep each database in sync from the RQ scheduler.'
+        )
+
+        parser.add_argument(
+            '--reprocess',
+            action='store_true',
+            help='Rebuild content from stored Notion responses, offline.'
+        )
+
+        parser.add_argument(
+            '--plan',
+            action='store_true',
+            help='Report what a sync would change without writing anything.'
+        )
+
+    def print_plan(self, dbname, counts, total):
+        self.stdout.write(dbname)
+        self.stdout.write(
+            '  Pages: %d to create, %d to update, %d to delete, '
+            '%d unchanged' % (
+                counts['pages_created'],
+                counts['pages_updated'],
+                counts['pages_deleted'],
+                counts['pages_unchanged']
+            )
+        )
+
+        self.stdout.write(
+            '  Blocks: %d to create, %d to update, %d to move, '
+            '%d to delete' % (
+                counts['blocks_created'],
+                counts['blocks_updated'],
+                counts['blocks_moved'],
+                counts['blocks_deleted']
+            )
+        )
+
+        self.stdout.write(
+            '  Estimated cost: %d API calls, %d media downloads, '
+            '%d OG images' % (
+                counts['api_calls'],
+                counts['media'],
+                counts['og_images']
+            )
+        )
+
+        if total and counts['pages_deleted'] * 10 >= total:
+            self.stdout.write(
+                self.style.WARNING(
+                    '  %d of %d existing rows would be deleted' % (
+                        counts['pages_deleted'],
+                        total
+                    )
+                )
+            )
+
     def handle(self, *args, **options):
         for dbname, dbid in settings.DATABASES.items():
+            if options['plan']:
+                Model = apps.get_model(dbname)
+                report = plan(
+                    Model,
+                    full=options['full'],
+                    concurrency=options['concurrency'],
+                    incremental=options['incremental']
+                )
+
+                for name, counts in report.items():
+                    self.print_plan(name, counts, Model.objects.count())
+
+                continue
+
+            if options['schedule']:
+                schedule_sync(dbname)
+                self.stdout.write('Scheduled %s' % dbname)
+                continue
+
+            if options['enqueue']:
+                sync_database.delay(
+                    dbname,
+                    full=options['full'],
+                    incremental=options['incremental']
+                )
+
+                self.stdout.write('Queued %s' % dbname)
+                continue
+
             Model = apps.get_model(dbname)
-            Model.objects.sync()
+            Model.objects.sync(
+                full=options['full'],
+                concurrency=options['concurrency'],
+                reprocess=options['reprocess'],
+                incremental=options['incremental']
+            )
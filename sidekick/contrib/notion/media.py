@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from urllib.parse import urlsplit
+from . import settings
+from .models import Blob
+import os
+import requests
+
+
+CHUNK_SIZE = 1024 * 64
+
+
+class DownloadDeferred(Exception):
+    pass
+
+
+def download(url):
+    scheme, domain, path, query, fragment = urlsplit(url)
+    temp = NamedTemporaryFile(suffix=os.path.splitext(path)[-1])
+
+    try:
+        with requests.get(
+            url,
+            stream=True,
+            timeout=settings.MEDIA_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                temp.write(chunk)
+    except Exception:
+        temp.close()
+        raise
+
+    temp.seek(0)
+    return temp
+
+
+def defer_download(url):
+    raise DownloadDeferred(url)
+
+
+def store(temp):
+    digest = sha256()
+    size = 0
+
+    for chunk in iter(lambda: temp.read(CHUNK_SIZE), b''):
+        digest.update(chunk)
+        size += len(chunk)
+
+    temp.seek(0)
+
+    with transaction.atomic():
+        blob, created = Blob.objects.select_for_update().get_or_create(
+            digest=digest.hexdigest()
+        )
+
+        if not created and blob.media and default_storage.exists(
+            blob.media.name
+        ):
+            return blob
+
+        blob.media = File(temp)
+        blob.size = size
+        blob.save()
+
+    return blob
+
+
+def attach(attachments, url, download=download):
+    scheme, domain, path, query, fragment = urlsplit(url)
+    baseurl = '%s://%s%s' % (scheme, domain, path)
+
+    for attachment in attachments.filter(
+        notion_url=baseurl
+    ).select_related('blob'):
+        media = attachment.blob and attachment.blob.media or attachment.media
+
+        if media and default_storage.exists(media.name):
+            return media.name
+
+        attachment.delete()
+
+    with download(url) as temp:
+        with transaction.atomic():
+            blob = store(temp)
+            attachments.create(notion_url=baseurl, blob=blob)
+            Blob.objects.filter(pk=blob.pk).update(
+                references=F('references') + 1
+            )
+
+    return blob.media.name
+
+
+def release(blob_id):
+    with transaction.atomic():
+        blob = Blob.objects.select_for_update().filter(pk=blob_id).first()
+
+        if blob is None:
+            return
+
+        if blob.references > 1:
+            blob.references -= 1
+            blob.save(update_fields=('references',))
+            return
+
+        storage = blob.media.storage
+        name = blob.media.name
+        blob.delete()
+
+        if name:
+            transaction.on_commit(lambda: storage.delete(name))
+
+
+class MediaFetcher(object):
+    def __init__(self, handler, concurrency=None):
+        self.handler = handler
+        self.concurrency = concurrency or settings.MEDIA_CONCURRENCY
+        self.results = {}
+
+    def prefetch(self, urls):
+        missing = {}
+
+        for url in dict.fromkeys(urls):
+            if url in self.results:
+                continue
+
+            try:
+                self.results[url] = self.handler(url, download=defer_download)
+            except DownloadDeferred:
+                missing[url] = None
+
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for url, temp in zip(missing, executor.map(download, missing)):
+                missing[url] = temp
+
+        for url, temp in missing.items():
+            with temp:
+                self.results[url] = self.handler(
+                    url,
+                    download=lambda url: temp
+                )
+
+    def get(self, url):
+        if url not in self.results:
+            self.results[url] = self.handler(url)
+
+        return self.results[url]
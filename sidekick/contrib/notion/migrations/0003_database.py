@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0002_block_word_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Database',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notion_id', models.UUIDField(editable=False, unique=True, verbose_name='Notion ID')),
+                ('name', models.CharField(max_length=100)),
+                ('last_edited', models.DateTimeField(blank=True, null=True)),
+                ('synced', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
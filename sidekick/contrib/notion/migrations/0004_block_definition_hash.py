@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0003_database'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='block',
+            name='definition_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
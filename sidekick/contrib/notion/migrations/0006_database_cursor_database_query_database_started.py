@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0005_person'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='database',
+            name='cursor',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='database',
+            name='query',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='database',
+            name='started',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
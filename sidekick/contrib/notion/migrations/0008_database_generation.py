@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0007_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='database',
+            name='generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:47
+
+import sidekick.contrib.notion.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0008_database_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(editable=False, max_length=64, unique=True)),
+                ('media', models.FileField(max_length=255, upload_to=sidekick.contrib.notion.models.Blob.upload_media)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('references', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
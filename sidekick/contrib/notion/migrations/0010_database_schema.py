@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0009_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='database',
+            name='schema',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
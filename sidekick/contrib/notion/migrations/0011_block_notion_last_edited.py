@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0010_database_schema'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='block',
+            name='notion_last_edited',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Notion last edited'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0011_block_notion_last_edited'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Snapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notion_id', models.UUIDField(editable=False, unique=True, verbose_name='Notion ID')),
+                ('last_edited', models.DateTimeField()),
+                ('data', models.BinaryField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0012_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='database',
+            name='scheduled',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
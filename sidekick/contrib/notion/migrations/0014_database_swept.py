@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0013_database_scheduled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='database',
+            name='swept',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
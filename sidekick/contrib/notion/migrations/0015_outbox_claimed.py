@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notion', '0014_database_swept'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outbox',
+            name='claimed',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
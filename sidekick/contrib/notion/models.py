@@ -4,7 +4,10 @@ from django.db import models
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from markdown import markdown
+from .helpers import decompress
+from .progress import Progress
 from .query import BlockQuerySet
+import os
 
 
 class Block(models.Model):
@@ -19,6 +22,18 @@ class Block(models.Model):
     type = models.CharField(max_length=300)
     properties = models.JSONField(default=dict, blank=True)
     word_count = models.PositiveIntegerField(default=0)
+    definition_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False
+    )
+
+    notion_last_edited = models.DateTimeField(
+        'Notion last edited',
+        null=True,
+        blank=True,
+        editable=False
+    )
 
     def __str__(self):
         return self.type.capitalize().replace('_', ' ')
@@ -36,14 +51,100 @@ class Block(models.Model):
             }
         )
 
-    def save(self, *args, **kwargs):
-        self.word_count = 0
-
+    def count_words(self):
         if text := self.properties.get('text'):
             text = strip_tags(markdown(text))
-            self.word_count = len(text.split())
+            return len(text.split())
 
+        return 0
+
+    def save(self, *args, **kwargs):
+        self.word_count = self.count_words()
         super().save(*args, **kwargs)
 
     class Meta:
         ordering = ('ordering',)
+
+
+class Database(models.Model):
+    notion_id = models.UUIDField('Notion ID', unique=True, editable=False)
+    name = models.CharField(max_length=100)
+    last_edited = models.DateTimeField(null=True, blank=True)
+    synced = models.DateTimeField(null=True, blank=True)
+    started = models.DateTimeField(null=True, blank=True)
+    query = models.JSONField(default=dict, blank=True)
+    cursor = models.CharField(max_length=255, blank=True)
+    generation = models.PositiveIntegerField(default=0)
+    schema = models.JSONField(default=dict, blank=True, editable=False)
+    swept = models.DateTimeField(null=True, blank=True)
+    scheduled = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.name
+
+    def get_progress(self):
+        return Progress(self.notion_id).get()
+
+
+class Person(models.Model):
+    notion_id = models.UUIDField('Notion ID', unique=True, editable=False)
+    user = models.ForeignKey(
+        'auth.User',
+        related_name='notion_people',
+        on_delete=models.CASCADE
+    )
+
+    checked = models.DateTimeField()
+
+    def __str__(self):
+        return str(self.user)
+
+    class Meta:
+        verbose_name_plural = 'people'
+
+
+class Outbox(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey()
+    queued = models.DateTimeField()
+    claimed = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+
+    def __str__(self):
+        return '%s #%d' % (self.content_type, self.object_id)
+
+    class Meta:
+        ordering = ('queued',)
+        unique_together = ('content_type', 'object_id')
+        verbose_name_plural = 'outbox'
+
+
+class Blob(models.Model):
+    def upload_media(self, filename):
+        return 'blobs/%s/%s%s' % (
+            self.digest[:2],
+            self.digest,
+            os.path.splitext(filename)[-1]
+        )
+
+    digest = models.CharField(max_length=64, unique=True, editable=False)
+    media = models.FileField(max_length=255, upload_to=upload_media)
+    size = models.PositiveBigIntegerField(default=0)
+    references = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.digest
+
+
+class Snapshot(models.Model):
+    notion_id = models.UUIDField('Notion ID', unique=True, editable=False)
+    last_edited = models.DateTimeField()
+    data = models.BinaryField()
+
+    def __str__(self):
+        return str(self.notion_id)
+
+    def get_definition(self):
+        return decompress(self.data)
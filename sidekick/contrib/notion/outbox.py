@@ -0,0 +1,19 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+from .jobs import flush_outbox
+from .models import Outbox
+
+
+def push(obj):
+    Outbox.objects.update_or_create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        defaults={
+            'queued': timezone.now(),
+            'attempts': 0,
+            'error': ''
+        }
+    )
+
+    transaction.on_commit(flush_outbox.delay)
@@ -0,0 +1,193 @@
+from collections import Counter
+from dateutil.parser import parse as parse_date
+from django.apps import apps
+from django.contrib.contenttypes.fields import GenericRelation
+from django.db.models.fields.related import RelatedField
+from django.utils import timezone
+from urllib.parse import urlsplit
+from uuid import UUID
+from . import settings
+from .blocks import Block
+from .client import get_client
+from .fetch import fetch_blocks
+from .models import Block as BlockModel, Database, Person
+from .properties import Property
+from .ratelimit import limiter
+from .schema import get_schema
+from .sync import get_query, is_unchanged, iterate_database
+
+
+def get_blocks_field(Model):
+    for field in Model._meta.get_fields():
+        if (
+            isinstance(field, GenericRelation) and
+            field.related_model is BlockModel
+        ):
+            return field
+
+
+def get_changed_fields(schema, obj, doc):
+    changed = []
+
+    for name, attrs, field in schema.get_fields(doc['properties']):
+        if isinstance(field, RelatedField):
+            continue
+
+        value = Property(name, attrs).to_python()
+        if obj is None or getattr(obj, field.name) != value:
+            changed.append(field.name)
+
+    return changed
+
+
+def is_attached(obj, url):
+    if obj is None or not hasattr(obj, 'attachments'):
+        return False
+
+    scheme, domain, path, query, fragment = urlsplit(url)
+    return obj.attachments.filter(
+        notion_url='%s://%s%s' % (scheme, domain, path)
+    ).exists()
+
+
+def plan(Model, full=False, concurrency=None, incremental=False):
+    notion = get_client()
+    blocks_field = get_blocks_field(Model)
+    has_og_image = any(
+        field.name == 'og_image'
+        for field in Model._meta.get_fields()
+    )
+
+    report = {}
+
+    for dbname, dbid in settings.DATABASES.items():
+        if not issubclass(apps.get_model(dbname), Model):
+            continue
+
+        database = Database.objects.filter(
+            notion_id=dbid
+        ).first() or Database(
+            notion_id=dbid,
+            name=dbname
+        )
+
+        filtered = incremental and not full and (
+            database.last_edited is not None
+        )
+
+        schema = get_schema(Model, database, save=False)
+        query = filtered and get_query(database) or {}
+        users = set(
+            str(notion_id)
+            for notion_id in Person.objects.filter(
+                checked__gte=timezone.now() - timezone.timedelta(
+                    seconds=settings.USER_TTL
+                )
+            ).values_list('notion_id', flat=True)
+        )
+
+        new_users = set()
+        counts = Counter()
+        seen = 0
+        calls = limiter.requests
+
+        for batch, cursor in iterate_database(notion, dbid, **query):
+            objs = Model.objects.in_bulk(
+                [result['id'] for result in batch],
+                field_name='notion_id'
+            )
+
+            changed = []
+
+            for result in batch:
+                obj = objs.get(UUID(result['id']))
+
+                if result.get('archived') or result.get('in_trash'):
+                    if obj is not None and filtered:
+                        counts['pages_deleted'] += 1
+
+                    continue
+
+                if obj is None:
+                    counts['pages_created'] += 1
+                    changed.append((result, obj))
+                else:
+                    seen += 1
+
+                    if not full and is_unchanged(
+                        getattr(obj, 'notion_last_edited', None),
+                        parse_date(result['last_edited_time']),
+                        database
+                    ):
+                        counts['pages_unchanged'] += 1
+                        continue
+
+                    counts['pages_updated'] += 1
+                    changed.append((result, obj))
+
+                user_id = result['created_by']['id']
+                if hasattr(Model, 'author') and user_id not in users:
+                    new_users.add(user_id)
+
+            trees = {}
+            if blocks_field is not None:
+                trees = fetch_blocks(
+                    [result['id'] for result, obj in changed],
+                    concurrency
+                )
+
+            for result, obj in changed:
+                regenerate = any(
+                    fname in ('title', 'subtitle')
+                    for fname in get_changed_fields(schema, obj, result)
+                )
+
+                existing = {}
+                if obj is not None and blocks_field is not None:
+                    existing = {
+                        str(notion_id): (ordering, block_hash)
+                        for notion_id, ordering, block_hash in getattr(
+                            obj,
+                            blocks_field.name
+                        ).values_list(
+                            'notion_id',
+                            'ordering',
+                            'definition_hash'
+                        )
+                    }
+
+                for ordering, definition in enumerate(
+                    trees.get(result['id'], [])
+                ):
+                    block = Block(definition)
+                    old = existing.pop(definition['id'], None)
+
+                    if old is None:
+                        counts['blocks_created'] += 1
+                    elif full or old[1] != block.get_hash():
+                        counts['blocks_updated'] += 1
+                    else:
+                        if old[0] != ordering:
+                            counts['blocks_moved'] += 1
+
+                        continue
+
+                    for url in block.get_media():
+                        if not is_attached(obj, url):
+                            counts['media'] += 1
+
+                    if block.type == 'paragraph':
+                        regenerate = True
+
+                counts['blocks_deleted'] += len(existing)
+
+                if has_og_image and regenerate:
+                    counts['og_images'] += 1
+
+        if not filtered:
+            counts['pages_deleted'] += Model.objects.count() - seen
+
+        counts['api_calls'] = limiter.requests - calls + len(new_users)
+        report[dbname] = counts
+
+    return report
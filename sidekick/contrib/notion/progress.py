@@ -0,0 +1,62 @@
+from django.utils import timezone
+from redis.exceptions import RedisError
+from uuid import UUID
+from .helpers import get_redis
+import logging
+
+
+class Progress(object):
+    def __init__(self, dbid):
+        self.key = 'notion:progress:%s' % UUID(str(dbid))
+
+    def call(self, method, *args, **kwargs):
+        try:
+            return getattr(get_redis(), method)(self.key, *args, **kwargs)
+        except RedisError:
+            logging.warning('Notion sync progress unavailable', exc_info=True)
+
+    def start(self, resumed=False):
+        mapping = {
+            'status': 'running',
+            'started': timezone.now().isoformat(),
+            'finished': '',
+            'error': ''
+        }
+
+        if not resumed:
+            mapping.update(
+                pages_seen=0,
+                pages_written=0,
+                api_calls=0
+            )
+
+        self.call('hset', mapping=mapping)
+
+    def incr(self, field, amount=1):
+        if amount:
+            self.call('hincrby', field, amount)
+
+    def finish(self):
+        self.call(
+            'hset',
+            mapping={
+                'status': 'finished',
+                'finished': timezone.now().isoformat()
+            }
+        )
+
+    def fail(self, error):
+        self.call(
+            'hset',
+            mapping={
+                'status': 'failed',
+                'finished': timezone.now().isoformat(),
+                'error': str(error)
+            }
+        )
+
+    def get(self):
+        return {
+            key.decode('utf-8'): value.decode('utf-8')
+            for key, value in (self.call('hgetall') or {}).items()
+        }
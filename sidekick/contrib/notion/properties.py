@@ -1,15 +1,20 @@
 from dateutil.parser import parse as parse_date
 from django.apps import apps
+from django.utils.functional import cached_property
+from uuid import UUID
 from . import settings
 
 
 class PropertyBase(object):
-    def __init__(self, name, definition):
+    def __init__(self, name, definition, handlers={}):
         self.name = name
         self.type = definition['type']
         self.value = definition[self.type]
         self._definition = definition
 
+        for key, func in handlers.items():
+            setattr(self, 'handle_%s' % key, func)
+
     def to_python(self):
         return self.value
 
@@ -114,21 +119,24 @@ class CheckboxProperty(PropertyBase):
 
 
 class RelationProperty(PropertyBase):
-    def to_python(self):
+    def handle_relation(self, ids):
         items = []
 
         for dbname, dbid in settings.DATABASES.items():
             Model = apps.get_model(dbname)
             items.extend(
                 Model.objects.filter(
-                    notion_id__in=[
-                        item['id'] for item in self.value
-                    ]
+                    notion_id__in=ids
                 ).distinct()
             )
 
         return set(items)
 
+    def to_python(self):
+        return self.handle_relation(
+            [item['id'] for item in self.value]
+        )
+
     def from_python(self, value):
         return {
             self.type: [
@@ -142,7 +150,38 @@ class RelationProperty(PropertyBase):
         }
 
 
-def Property(name, definition):
+class RelationResolver(object):
+    def __init__(self):
+        self.ids = set()
+
+    def add(self, definition):
+        if definition['type'] == 'relation':
+            self.ids.update(
+                UUID(item['id']) for item in definition['relation']
+            )
+
+    @cached_property
+    def objects(self):
+        objects = {}
+
+        for dbname, dbid in settings.DATABASES.items():
+            Model = apps.get_model(dbname)
+
+            for obj in Model.objects.filter(notion_id__in=self.ids):
+                objects.setdefault(obj.notion_id, []).append(obj)
+
+        return objects
+
+    def get(self, ids):
+        items = []
+
+        for notion_id in ids:
+            items.extend(self.objects.get(UUID(notion_id), []))
+
+        return set(items)
+
+
+def Property(name, definition, handle_relation=None):
     prop_type = definition['type']
 
     try:
@@ -159,7 +198,15 @@ def Property(name, definition):
             'checkbox': CheckboxProperty,
             'relation': RelationProperty
         }[prop_type]
-
-        return prop_cls(name, definition)
     except KeyError:
         raise Exception('Unsupported property type', prop_type)
+
+    handlers = {}
+    if handle_relation is not None:
+        handlers['relation'] = handle_relation
+
+    return prop_cls(
+        name,
+        definition,
+        handlers=handlers
+    )
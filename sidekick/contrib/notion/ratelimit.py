@@ -0,0 +1,165 @@
+from django.utils.functional import cached_property
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+from redis.exceptions import RedisError
+from threading import Lock
+from . import settings
+from .helpers import get_redis
+import asyncio
+import logging
+import random
+import time
+
+
+RETRY_STATUSES = (409, 429, 500, 502, 503, 504)
+
+ACQUIRE_SCRIPT = '''
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'paused')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+local paused = tonumber(state[3]) or 0
+
+if paused > now then
+    return tostring(paused - now)
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+if tokens < 1 then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    return tostring((1 - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'updated', now)
+redis.call('EXPIRE', KEYS[1], 3600)
+redis.call('HINCRBY', KEYS[2], 'requests', 1)
+return '0'
+'''
+
+PAUSE_SCRIPT = '''
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local paused = tonumber(redis.call('HGET', KEYS[1], 'paused')) or 0
+redis.call('HSET', KEYS[1], 'paused', math.max(paused, now + tonumber(ARGV[1])))
+redis.call('EXPIRE', KEYS[1], 3600)
+'''
+
+
+class RateLimiter(object):
+    def __init__(
+        self, key, rate, retries=5, backoff=0.5, max_backoff=30
+    ):
+        self.key = key
+        self.rate = rate
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.requests = 0
+        self.lock = Lock()
+
+    @property
+    def redis(self):
+        return get_redis()
+
+    @cached_property
+    def acquire_script(self):
+        return self.redis.register_script(ACQUIRE_SCRIPT)
+
+    @cached_property
+    def pause_script(self):
+        return self.redis.register_script(PAUSE_SCRIPT)
+
+    def count(self):
+        with self.lock:
+            self.requests += 1
+
+    def get_wait(self):
+        try:
+            return float(
+                self.acquire_script(
+                    keys=(self.key, '%s:counters' % self.key),
+                    args=(self.rate, max(1, self.rate))
+                )
+            )
+        except RedisError:
+            logging.warning('Notion rate limiter unavailable', exc_info=True)
+            return 0
+
+    def wait(self):
+        while (wait := self.get_wait()) > 0:
+            time.sleep(wait)
+
+        self.count()
+
+    async def async_wait(self):
+        while (wait := await asyncio.to_thread(self.get_wait)) > 0:
+            await asyncio.sleep(wait)
+
+        self.count()
+
+    def pause(self, seconds):
+        try:
+            self.pause_script(keys=(self.key,), args=(seconds,))
+        except RedisError:
+            logging.warning('Notion rate limiter unavailable', exc_info=True)
+
+    def incr(self, name):
+        try:
+            self.redis.hincrby('%s:counters' % self.key, name, 1)
+        except RedisError:
+            logging.warning('Notion rate limiter unavailable', exc_info=True)
+
+    def get_counters(self):
+        return {
+            key.decode('utf-8'): int(value)
+            for key, value in self.redis.hgetall(
+                '%s:counters' % self.key
+            ).items()
+        }
+
+    def get_retry_delay(self, ex, attempt, idempotent=True):
+        if attempt >= self.retries:
+            return None
+
+        if not idempotent and not (
+            isinstance(ex, HTTPResponseError) and ex.status == 429
+        ):
+            return None
+
+        if isinstance(ex, RequestTimeoutError):
+            retry_after = None
+        elif (
+            isinstance(ex, HTTPResponseError) and
+            ex.status in RETRY_STATUSES
+        ):
+            retry_after = ex.headers.get('Retry-After')
+        else:
+            return None
+
+        if isinstance(ex, HTTPResponseError) and ex.status == 429:
+            self.incr('throttled')
+
+        self.incr('retried')
+
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+            else:
+                self.pause(delay)
+                return delay
+
+        return random.uniform(
+            0,
+            min(self.max_backoff, self.backoff * 2 ** attempt)
+        )
+
+
+limiter = RateLimiter(
+    'notion:ratelimit',
+    settings.RATE_LIMIT,
+    retries=settings.MAX_RETRIES
+)
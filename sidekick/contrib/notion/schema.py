@@ -0,0 +1,91 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.fields.related import RelatedField
+from .client import get_client
+from .properties import Property
+
+
+SCHEMAS = {}
+
+
+class Schema(object):
+    def __init__(self, Model, properties):
+        self.properties = properties
+        self.fields = {}
+
+        try:
+            Model._meta.get_field('title')
+        except FieldDoesNotExist:
+            has_title = False
+        else:
+            has_title = True
+
+        for name, definition in properties.items():
+            if definition['type'] == 'title' and has_title:
+                fname = 'title'
+            else:
+                fname = name.replace(' ', '_').lower()
+
+            try:
+                field = Model._meta.get_field(fname)
+            except FieldDoesNotExist:
+                continue
+
+            self.fields[definition['id']] = field
+
+    def matches(self, properties):
+        for name, attrs in properties.items():
+            definition = self.properties.get(name)
+
+            if definition is None:
+                return False
+
+            if (definition['id'], definition['type']) != (
+                attrs['id'],
+                attrs['type']
+            ):
+                return False
+
+        return True
+
+    def get_fields(self, properties):
+        for name, attrs in properties.items():
+            if field := self.fields.get(attrs['id']):
+                yield name, attrs, field
+
+    def to_python(self, properties, handle_relation=None):
+        for name, attrs, field in self.get_fields(properties):
+            prop = Property(name, attrs, handle_relation=handle_relation)
+            yield field, prop.to_python()
+
+    def from_python(self, obj):
+        attrs = {}
+
+        for name, definition, field in self.get_fields(self.properties):
+            value = getattr(obj, field.name)
+
+            if isinstance(field, RelatedField):
+                value = value.all()
+
+            if value is not None:
+                prop = Property(name, definition)
+                attrs[definition['id']] = prop.from_python(value)
+
+        return attrs
+
+
+def get_schema(Model, database, refresh=False, save=True):
+    if refresh or not database.schema:
+        response = get_client().databases.retrieve(str(database.notion_id))
+
+        if not save:
+            return Schema(Model, response['properties'])
+
+        database.schema = response['properties']
+        database.save(update_fields=('schema',))
+        SCHEMAS.pop(database.notion_id, None)
+
+    schema = SCHEMAS.get(database.notion_id)
+    if schema is None or schema.properties != database.schema:
+        schema = SCHEMAS[database.notion_id] = Schema(Model, database.schema)
+
+    return schema
@@ -0,0 +1,374 @@
+from django.apps import apps
+from django.db import models
+from django.db.models.fields.related import RelatedField
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+from uuid import NAMESPACE_URL, UUID, uuid5
+import json
+import re
+import time
+
+
+BLOCK_TYPES = (
+    'paragraph',
+    'heading_2',
+    'paragraph',
+    'image',
+    'bulleted_list_item',
+    'quote',
+    'callout',
+    'divider'
+)
+
+EDITED = '2024-01-01T00:00:00.000Z'
+USER_EMAIL = 'notion@example.com'
+
+
+def get_id(*parts):
+    return str(uuid5(NAMESPACE_URL, '/'.join(str(part) for part in parts)))
+
+
+def get_text(text):
+    return [
+        {
+            'type': 'text',
+            'text': {
+                'content': text,
+                'link': None
+            },
+            'annotations': {
+                'bold': False,
+                'italic': False,
+                'strikethrough': False,
+                'underline': False,
+                'code': False,
+                'color': 'default'
+            },
+            'plain_text': text,
+            'href': None
+        }
+    ]
+
+
+class FakeNotion(object):
+    def __init__(
+        self, databases, pages=100, blocks=50, media_size=4096, latency=0
+    ):
+        self.databases = {
+            get_id('database', dbname): apps.get_model(dbname)
+            for dbname in databases
+        }
+
+        self.pages = pages
+        self.blocks = blocks
+        self.media_size = media_size
+        self.latency = latency
+        self.edited = EDITED
+        self.requests = 0
+        self.parents = {}
+        self.lock = Lock()
+        self.server = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address
+        return 'http://%s:%d' % (host, port)
+
+    def get_dbid(self, Model):
+        for dbid, DatabaseModel in self.databases.items():
+            if DatabaseModel is Model:
+                return dbid
+
+    def get_properties(self, Model, i):
+        properties = {}
+        field_names = [field.name for field in Model._meta.get_fields()]
+        title_field = 'title' in field_names and 'title' or 'name'
+
+        for field in Model._meta.get_fields():
+            if not getattr(field, 'editable', False) or field.auto_created:
+                continue
+
+            if field.name in ('notion_id', 'author', 'ordering'):
+                continue
+
+            name = field.name.replace('_', ' ').title()
+
+            if field.name == title_field:
+                value = {
+                    'type': 'title',
+                    'title': get_text('%s %d' % (name, i))
+                }
+            elif field.name == 'status':
+                value = {
+                    'type': 'status',
+                    'status': {
+                        'name': 'Published'
+                    }
+                }
+            elif isinstance(field, RelatedField):
+                dbid = self.get_dbid(field.related_model)
+
+                if dbid is None:
+                    value = {
+                        'type': 'multi_select',
+                        'multi_select': [
+                            {
+                                'name': 'tag-%d' % (i % 10)
+                            }
+                        ]
+                    }
+                else:
+                    value = {
+                        'type': 'relation',
+                        'relation': [
+                            {
+                                'id': get_id(dbid, j)
+                            } for j in range(min(i, 3))
+                        ]
+                    }
+            elif isinstance(field, models.EmailField):
+                value = {
+                    'type': 'email',
+                    'email': 'person-%d@example.com' % i
+                }
+            elif isinstance(field, models.SlugField):
+                value = {
+                    'type': 'rich_text',
+                    'rich_text': get_text(
+                        '%s-%d' % (Model._meta.model_name, i)
+                    )
+                }
+            elif isinstance(field, models.DateTimeField):
+                value = {
+                    'type': 'date',
+                    'date': {
+                        'start': EDITED
+                    }
+                }
+            elif isinstance(field, models.BooleanField):
+                value = {
+                    'type': 'checkbox',
+                    'checkbox': i % 2 == 0
+                }
+            elif isinstance(field, (models.CharField, models.TextField)):
+                value = {
+                    'type': 'rich_text',
+                    'rich_text': get_text('%s %d' % (name, i))
+                }
+            else:
+                continue
+
+            properties[name] = {
+                'id': field.name,
+                **value
+            }
+
+        return properties
+
+    def get_page(self, dbid, i):
+        return {
+            'object': 'page',
+            'id': get_id(dbid, i),
+            'created_time': EDITED,
+            'last_edited_time': self.edited,
+            'created_by': {
+                'object': 'user',
+                'id': get_id('user')
+            },
+            'parent': {
+                'type': 'database_id',
+                'database_id': dbid
+            },
+            'archived': False,
+            'in_trash': False,
+            'properties': self.get_properties(self.databases[dbid], i)
+        }
+
+    def get_block(self, parent_id, i, nested=False):
+        block_id = get_id(parent_id, i)
+        block_type = BLOCK_TYPES[i % len(BLOCK_TYPES)]
+        has_children = not nested and block_type in (
+            'bulleted_list_item',
+            'callout'
+        )
+
+        if has_children:
+            with self.lock:
+                self.parents[block_id] = True
+
+        if block_type == 'image':
+            value = {
+                'caption': [],
+                'type': 'file',
+                'file': {
+                    'url': '%s/media/%s.png?expires=%d' % (
+                        self.base_url,
+                        block_id,
+                        time.time()
+                    ),
+                    'expiry_time': self.edited
+                }
+            }
+        elif block_type == 'divider':
+            value = {}
+        else:
+            value = {
+                'rich_text': get_text('Block %d of %s' % (i, parent_id)),
+                'color': 'default'
+            }
+
+            if block_type == 'callout':
+                value['icon'] = {
+                    'type': 'emoji',
+                    'emoji': '💡'
+                }
+
+        return {
+            'object': 'block',
+            'id': block_id,
+            'type': block_type,
+            'has_children': has_children,
+            'last_edited_time': self.edited,
+            block_type: value
+        }
+
+    def paginate(self, count, get_item, options):
+        start = int(options.get('start_cursor') or 0)
+        size = int(options.get('page_size') or 100)
+        end = min(count, start + size)
+
+        return {
+            'object': 'list',
+            'results': [get_item(i) for i in range(start, end)],
+            'has_more': end < count,
+            'next_cursor': end < count and str(end) or None
+        }
+
+    def respond(self, method, path, query, body):
+        if match := re.match(r'^/v1/databases/([^/]+)/query$', path):
+            dbid = str(UUID(match.group(1)))
+
+            return 200, self.paginate(
+                self.pages,
+                lambda i: self.get_page(dbid, i),
+                body
+            )
+
+        if match := re.match(r'^/v1/databases/([^/]+)$', path):
+            dbid = str(UUID(match.group(1)))
+
+            return 200, {
+                'object': 'database',
+                'id': dbid,
+                'last_edited_time': self.edited,
+                'properties': self.get_page(dbid, 0)['properties']
+            }
+
+        if match := re.match(r'^/v1/blocks/([^/]+)/children$', path):
+            parent_id = str(UUID(match.group(1)))
+            nested = parent_id in self.parents
+
+            return 200, self.paginate(
+                nested and 2 or self.blocks,
+                lambda i: self.get_block(parent_id, i, nested),
+                query
+            )
+
+        if match := re.match(r'^/v1/pages/([^/]+)$', path):
+            page_id = str(UUID(match.group(1)))
+
+            if method == 'PATCH':
+                return 200, {
+                    'object': 'page',
+                    'id': page_id
+                }
+
+            for dbid in self.databases:
+                for i in range(self.pages):
+                    if get_id(dbid, i) == page_id:
+                        return 200, self.get_page(dbid, i)
+
+        if path == '/v1/pages' and method == 'POST':
+            return 200, {
+                'object': 'page',
+                'id': get_id('page', time.time())
+            }
+
+        if match := re.match(r'^/v1/users/([^/]+)$', path):
+            return 200, {
+                'object': 'user',
+                'id': match.group(1),
+                'type': 'person',
+                'person': {
+                    'email': USER_EMAIL
+                }
+            }
+
+        return 404, {
+            'object': 'error',
+            'status': 404,
+            'code': 'object_not_found',
+            'message': 'Could not find %s' % path
+        }
+
+    def get_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def handle_request(self):
+                with fake.lock:
+                    fake.requests += 1
+
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                scheme, domain, path, query, fragment = urlsplit(self.path)
+
+                if path.startswith('/media/'):
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'image/png')
+                    self.send_header('Content-Length', str(fake.media_size))
+                    self.end_headers()
+                    self.wfile.write(b'\0' * fake.media_size)
+                    return
+
+                length = int(self.headers.get('Content-Length') or 0)
+                body = length and json.loads(self.rfile.read(length)) or {}
+                status, response = fake.respond(
+                    self.command,
+                    path,
+                    {
+                        key: values[0]
+                        for key, values in parse_qs(query).items()
+                    },
+                    body
+                )
+
+                content = json.dumps(response).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = handle_request
+            do_POST = handle_request
+            do_PATCH = handle_request
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.server = ThreadingHTTPServer(
+            ('127.0.0.1', 0),
+            self.get_handler()
+        )
+        self.server.daemon_threads = True
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -1,28 +1,196 @@
+from concurrent.futures import ThreadPoolExecutor
+from dateutil.parser import parse as parse_date
 from django.apps import apps
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist
-from django.db import transaction
-from django.db.models import Model as DjangoModel
+from django.db import connection, transaction
+from django.db.models import Model as DjangoModel, Q
 from django.db.models.fields.related import RelatedField
-from notion_client import Client
-from notion_client.helpers import iterate_paginated_api
+from django.utils import timezone
+from notion_client import APIErrorCode, APIResponseError
+from uuid import UUID
 from . import settings
-from .blocks import Block
-from .properties import Property
+from .blocks import Block, iterate_blocks
+from .client import get_client
+from .fetch import fetch_blocks, resolve_children
+from .helpers import batched, compress
+from .links import LinkIndex
+from .lock import Lease
+from .media import DownloadDeferred, MediaFetcher, defer_download
+from .models import Block as NotionBlock, Database, Outbox, Person, Snapshot
+from .progress import Progress
+from .properties import RelationResolver
+from .ratelimit import limiter
+from .schema import get_schema
 from .signals import object_synced, objects_synced
 import json
+import logging
 
 
-def to_model(Model, before_clean=None, blocks_field=None, media_handler=''):
-    users = {}
+PAGE_SIZE = 100
 
-    def get_properties(doc):
-        returned = {}
-        for name, attrs in result['properties'].items():
-            returned[name] = Property(name, attrs)
 
-        return returned
+def is_unchanged(obj_edited, edited, database):
+    if obj_edited is None or obj_edited < edited or database.synced is None:
+        return False
+
+    return edited + timezone.timedelta(minutes=1) <= database.synced
+
+
+def get_query(database):
+    if database.last_edited is None:
+        return {}
+
+    return {
+        'filter': {
+            'timestamp': 'last_edited_time',
+            'last_edited_time': {
+                'on_or_after': database.last_edited.isoformat()
+            }
+        }
+    }
+
+
+def in_database(page, dbid):
+    parent = page.get('parent', {})
+
+    if parent.get('type') != 'database_id':
+        return False
+
+    return UUID(parent['database_id']) == UUID(dbid)
+
+
+def iterate_database(notion, dbid, cursor=None, **query):
+    while True:
+        response = notion.databases.query(
+            database_id=dbid,
+            start_cursor=cursor,
+            **query
+        )
+
+        next_cursor = response.get('has_more') and response.get('next_cursor')
+        batches = list(batched(response['results'], settings.BATCH_SIZE))
+
+        for i, batch in enumerate(batches):
+            if i == len(batches) - 1:
+                yield batch, next_cursor or None
+            else:
+                yield batch, cursor
+
+        if not next_cursor:
+            return
+
+        cursor = next_cursor
+
+
+def save_blocks(BlockModel, created, updated, moved):
+    BlockModel.objects.bulk_create(created, batch_size=PAGE_SIZE)
+    BlockModel.objects.bulk_update(
+        updated,
+        (
+            'type',
+            'ordering',
+            'properties',
+            'word_count',
+            'definition_hash',
+            'notion_last_edited'
+        ),
+        batch_size=PAGE_SIZE
+    )
+
+    BlockModel.objects.bulk_update(
+        moved,
+        ('ordering', 'notion_last_edited'),
+        batch_size=PAGE_SIZE
+    )
+
+
+def delete_objects(queryset):
+    Model = queryset.model
+    pks = list(queryset.values_list('pk', flat=True))
+
+    if not pks:
+        return
+
+    with transaction.atomic():
+        Snapshot.objects.filter(
+            Q(
+                notion_id__in=Model.objects.filter(
+                    pk__in=pks
+                ).values('notion_id')
+            ) | Q(
+                notion_id__in=NotionBlock.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Model),
+                    object_id__in=pks
+                ).values('notion_id')
+            )
+        ).delete()
+
+        Model.objects.filter(pk__in=pks).delete()
+
+
+def save_snapshots(snapshots):
+    Snapshot.objects.bulk_create(
+        snapshots,
+        batch_size=PAGE_SIZE,
+        update_conflicts=True,
+        unique_fields=('notion_id',),
+        update_fields=('last_edited', 'data')
+    )
+
+
+def set_relations(obj, after):
+    for fname, (field, value) in after.items():
+        related_manager = getattr(obj, fname)
+        added_rels = []
+        Related = field.related_model
+
+        for item in value:
+            if isinstance(item, str):
+                robj, _ = Related.objects.get_or_create(
+                    name=item
+                )
+            elif isinstance(item, DjangoModel):
+                robj = item
+            else:
+                raise Exception(item)
+
+            added_rels.append(robj)
+
+        related_manager.add(*added_rels)
+        related_manager.remove(
+            *related_manager.exclude(
+                pk__in=[r.pk for r in added_rels]
+            )
+        )
+
+
+def to_model(
+    Model, before_clean=None, blocks_field=None, media_handler='', full=False,
+    concurrency=None, pages=None, reprocess=False, incremental=False
+):
+    if reprocess:
+        return rebuild(
+            Model,
+            before_clean=before_clean,
+            blocks_field=blocks_field,
+            media_handler=media_handler,
+            concurrency=concurrency
+        )
+
+    users = {
+        str(person.notion_id): person.user
+        for person in Person.objects.filter(
+            checked__gte=timezone.now() - timezone.timedelta(
+                seconds=settings.USER_TTL
+            )
+        ).select_related('user')
+    }
+
+    trees = {}
+    edited_blocks = {}
+    links = LinkIndex()
 
     def get_user(definition):
         notion_id = definition['id']
@@ -34,32 +202,55 @@ def to_model(Model, before_clean=None, blocks_field=None, media_handler=''):
         email = response['person']['email']
 
         if user := User.objects.get(email=email):
+            Person.objects.update_or_create(
+                notion_id=notion_id,
+                defaults={
+                    'user': user,
+                    'checked': timezone.now()
+                }
+            )
+
             users[notion_id] = user
             return user
 
         raise Exception('%(name)s could not be found' % result)
 
-    def get_blocks(doc, obj):
-        returned = {}
-        block_response = notion.blocks.children.list(doc['id'])
-        kwargs = {}
+    def get_blocks(doc, media=None):
+        kwargs = {
+            'handle_link': links.get
+        }
 
-        if media_handler:
-            kwargs['handle_media'] = getattr(obj, media_handler)
+        if media is not None:
+            kwargs['handle_media'] = media.get
 
-        for result in block_response.get('results', []):
-            returned[result['id']] = Block(result, **kwargs)
+        if doc['id'] in trees:
+            batches = [trees.pop(doc['id'])]
+        else:
+            batches = batched(
+                iterate_blocks(notion, doc['id']),
+                PAGE_SIZE
+            )
 
-        return returned
+        for batch in batches:
+            for result in resolve_children(batch, concurrency, notion):
+                yield Block(result, **kwargs)
+
+    def is_block_unchanged(definition):
+        return not full and not definition['has_children'] and is_unchanged(
+            edited_blocks.get(definition['id']),
+            parse_date(definition['last_edited_time']),
+            database
+        )
 
     def has_field(name):
-        try:
-            Model._meta.get_field(name)
-            return True
-        except FieldDoesNotExist:
-            return False
+        return name in field_names
+
+    if concurrency is None:
+        concurrency = settings.CONCURRENCY
 
-    notion = Client(auth=settings.API_KEY)
+    field_names = set(field.name for field in Model._meta.get_fields())
+
+    notion = get_client()
     for dbname, dbid in settings.DATABASES.items():
         if not issubclass(apps.get_model(dbname), Model):
             continue
@@ -76,133 +267,553 @@ def to_model(Model, before_clean=None, blocks_field=None, media_handler=''):
             blocks_parent = obj_blocks_field.remote_field.name
             BlockModel = obj_blocks_field.related_model
 
-        pks = []
-        response = iterate_paginated_api(
-            notion.databases.query,
-            database_id=dbid
-        )
+        lease = Lease(dbid)
+        if pages is None and not lease.acquire():
+            logging.warning('Notion sync of %s is already running', dbname)
+            return Model.objects.none()
 
-        i = 0
-        for result in response:
-            with transaction.atomic():
-                objid = result['id']
-                obj = Model.objects.select_for_update().filter(
-                    notion_id=objid
-                ).first() or Model(
-                    notion_id=objid
+        try:
+            database, created = Database.objects.get_or_create(
+                notion_id=dbid,
+                defaults={
+                    'name': dbname
+                }
+            )
+
+            schema = get_schema(Model, database)
+            refreshed = False
+            resumed = pages is None and bool(database.cursor)
+            last_edited = database.last_edited
+
+            if resumed:
+                started = database.started
+                query = database.query
+                filtered = 'filter' in query
+            else:
+                started = timezone.now()
+                filtered = pages is not None or (
+                    incremental and not full and
+                    database.last_edited is not None
                 )
 
-                after = {}
+                query = filtered and get_query(database) or {}
+
+                if pages is None:
+                    database.generation += 1
 
-                for pname, prop in get_properties(result).items():
-                    try:
-                        prop_value = prop.to_python()
-                    except NotImplementedError:
-                        raise Exception(prop)
+            generation = database.generation
+            if pages is not None:
+                response = (
+                    (batch, None)
+                    for batch in batched(
+                        [page for page in pages if in_database(page, dbid)],
+                        settings.BATCH_SIZE
+                    )
+                )
+            else:
+                database.started = started
+                database.query = query
+                database.save()
+
+                response = iterate_database(
+                    notion,
+                    dbid,
+                    database.cursor or None,
+                    **query
+                )
+
+            pending = set(
+                Outbox.objects.filter(
+                    content_type=content_type,
+                    attempts__lt=settings.OUTBOX_ATTEMPTS
+                ).values_list('object_id', flat=True)
+            )
+
+            progress = Progress(dbid)
+            if pages is None:
+                progress.start(resumed)
+
+            renumber = has_field('ordering') and not (filtered or resumed)
+            i = 0
+            calls = limiter.requests
+            for batch, cursor in response:
+                known = {}
+                positions = {}
+                changed = []
+                skipped = []
+
+                if has_field('notion_last_edited'):
+                    known = {
+                        str(notion_id): (pk, obj_edited)
+                        for notion_id, pk, obj_edited in Model.objects.filter(
+                            notion_id__in=[result['id'] for result in batch]
+                        ).values_list('notion_id', 'pk', 'notion_last_edited')
+                    }
+
+                snapshotted = set(
+                    str(notion_id)
+                    for notion_id in Snapshot.objects.filter(
+                        notion_id__in=[result['id'] for result in batch]
+                    ).values_list('notion_id', flat=True)
+                )
+
+                for result in batch:
+                    if result.get('archived') or result.get('in_trash'):
+                        delete_objects(
+                            Model.objects.filter(notion_id=result['id'])
+                        )
 
-                    if prop.type == 'title' and has_field('title'):
-                        obj.title = prop_value
+                        continue
+
+                    edited = parse_date(result['last_edited_time'])
+                    if last_edited is None or edited > last_edited:
+                        last_edited = edited
+
+                    positions[result['id']] = i
+                    i += 1
+
+                    pk, obj_edited = known.get(result['id'], (None, None))
+                    if pk in pending or (
+                        not full and result['id'] in snapshotted and
+                        is_unchanged(obj_edited, edited, database)
+                    ):
+                        skipped.append(pk)
+
+                        if renumber:
+                            Model.objects.filter(pk=pk).exclude(
+                                ordering=positions[result['id']]
+                            ).update(
+                                ordering=positions[result['id']]
+                            )
                     else:
-                        fname = prop.name.replace(' ', '_').lower()
+                        changed.append(result)
 
-                        try:
-                            field = Model._meta.get_field(fname)
-                        except FieldDoesNotExist:
-                            continue
+                if skipped and has_field('notion_generation'):
+                    Model.objects.filter(pk__in=skipped).update(
+                        notion_generation=generation
+                    )
+
+                relations = RelationResolver()
+                for result in changed:
+                    for attrs in result['properties'].values():
+                        relations.add(attrs)
+
+                if obj_blocks_field is not None:
+                    rows = BlockModel.objects.filter(
+                        content_type=content_type,
+                        object_id__in=[
+                            known[result['id']][0]
+                            for result in changed
+                            if result['id'] in known
+                        ]
+                    ).values_list('notion_id', 'notion_last_edited')
+
+                    edited_blocks = {
+                        str(notion_id): block_edited
+                        for notion_id, block_edited in rows
+                    }
+
+                if obj_blocks_field is not None and concurrency > 1:
+                    trees = fetch_blocks(
+                        [result['id'] for result in changed],
+                        concurrency
+                    )
+
+                for result in changed:
+                    edited = parse_date(result['last_edited_time'])
+                    objid = result['id']
+                    values = {}
+                    after = {}
+
+                    if not refreshed and not schema.matches(
+                        result['properties']
+                    ):
+                        schema = get_schema(Model, database, refresh=True)
+                        refreshed = True
+
+                    for field, value in schema.to_python(
+                        result['properties'],
+                        handle_relation=relations.get
+                    ):
+                        if isinstance(field, RelatedField):
+                            after[field.name] = (field, value)
                         else:
-                            if isinstance(field, RelatedField):
-                                after[field.name] = (field, prop_value)
-                            else:
-                                setattr(obj, field.name, prop_value)
+                            values[field.name] = value
+
+                    if has_field('author'):
+                        values['author'] = get_user(result['created_by'])
+
+                    with transaction.atomic():
+                        obj = Model.objects.select_for_update().filter(
+                            notion_id=objid
+                        ).first() or Model(
+                            notion_id=objid
+                        )
+
+                        if obj.pk is not None and Outbox.objects.filter(
+                            content_type=content_type,
+                            object_id=obj.pk,
+                            attempts__lt=settings.OUTBOX_ATTEMPTS
+                        ).exists():
+                            if has_field('notion_generation'):
+                                Model.objects.filter(pk=obj.pk).update(
+                                    notion_generation=generation
+                                )
+
+                            continue
+
+                        for fname, value in values.items():
+                            setattr(obj, fname, value)
+
+                        if callable(before_clean):
+                            before_clean(obj, result)
+
+                        if renumber:
+                            obj.ordering = positions[objid]
+
+                        if has_field('notion_last_edited') and (
+                            obj_blocks_field is None
+                        ):
+                            obj.notion_last_edited = edited
+
+                        if has_field('notion_generation'):
+                            obj.notion_generation = generation
+
+                        obj.full_clean()
+                        obj.save()
+                        set_relations(obj, after)
+                        save_snapshots(
+                            [
+                                Snapshot(
+                                    notion_id=objid,
+                                    last_edited=edited,
+                                    data=compress(result)
+                                )
+                            ]
+                        )
+
+                    links.add(obj)
+
+                    if obj_blocks_field is None:
+                        object_synced.send(
+                            Model,
+                            instance=obj,
+                            direction='down'
+                        )
 
-                if has_field('author'):
-                    obj.author = get_user(result['created_by'])
+                        continue
 
-                if callable(before_clean):
-                    before_clean(obj, result)
+                    obj_blocks = getattr(obj, obj_blocks_field.name)
+                    existing = {
+                        str(obj_block.notion_id): obj_block
+                        for obj_block in obj_blocks.all()
+                    }
 
-                if has_field('ordering'):
-                    obj.ordering = i
+                    snapshotted = set(
+                        str(notion_id)
+                        for notion_id in Snapshot.objects.filter(
+                            notion_id__in=existing.keys()
+                        ).values_list('notion_id', flat=True)
+                    )
 
-                obj.full_clean()
-                obj.save()
-                pks.append(obj.pk)
+                    created = []
+                    updated = []
+                    moved = []
+                    stale = []
+                    snapshots = []
+                    media = None
+                    unresolved = False
+
+                    if media_handler:
+                        media = MediaFetcher(getattr(obj, media_handler))
+
+                    blocks = get_blocks(result, media)
+                    for ordering, block in enumerate(blocks):
+                        block_id = block._definition['id']
+                        block_edited = parse_date(
+                            block._definition['last_edited_time']
+                        )
 
-                for fname, (field, value) in after.items():
-                    related_manager = getattr(obj, fname)
-                    added_rels = []
-                    Related = field.related_model
+                        obj_block = existing.pop(block_id, None)
+                        unchanged = obj_block is not None and (
+                            is_block_unchanged(block._definition) and
+                            not block.get_links()
+                        )
 
-                    for item in value:
-                        if isinstance(item, str):
-                            robj, _ = Related.objects.get_or_create(
-                                name=item
+                        if not unchanged or block_id not in snapshotted:
+                            snapshots.append(
+                                Snapshot(
+                                    notion_id=block_id,
+                                    last_edited=block_edited,
+                                    data=compress(block._definition)
+                                )
                             )
-                        elif isinstance(item, DjangoModel):
-                            robj = item
+
+                        if unchanged:
+                            if obj_block.ordering != ordering:
+                                obj_block.ordering = ordering
+                                moved.append(obj_block)
+
+                            continue
+
+                        block_hash = block.get_hash()
+                        if block.has_unresolved_links():
+                            unresolved = True
+
+                        if (
+                            not full and obj_block is not None and
+                            obj_block.definition_hash == block_hash
+                        ):
+                            if (
+                                obj_block.ordering != ordering or
+                                obj_block.notion_last_edited != block_edited
+                            ):
+                                obj_block.ordering = ordering
+                                obj_block.notion_last_edited = block_edited
+                                moved.append(obj_block)
+
+                            continue
+
+                        if obj_block is None:
+                            obj_block = BlockModel(
+                                **{
+                                    blocks_parent: obj
+                                },
+                                notion_id=block_id,
+                                content_type=content_type,
+                                object_id=obj.pk
+                            )
+
+                            created.append(obj_block)
                         else:
-                            raise Exception(item)
-
-                        added_rels.append(robj)
-                    
-                    related_manager.add(*added_rels)
-                    related_manager.remove(
-                        *related_manager.exclude(
-                            pk__in=[r.pk for r in added_rels]
+                            updated.append(obj_block)
+
+                        obj_block.type = block.type
+                        obj_block.ordering = ordering
+                        obj_block.definition_hash = block_hash
+                        obj_block.notion_last_edited = block_edited
+                        stale.append((obj_block, block))
+
+                    if media is not None:
+                        media.prefetch(
+                            url
+                            for obj_block, block in stale
+                            for url in block.get_media()
                         )
-                    )
 
-                i += 1
+                    for obj_block, block in stale:
+                        try:
+                            obj_block.properties = block.to_python()
+                        except Exception as ex:
+                            print(json.dumps(block._definition, indent=4))
+                            raise Exception(
+                                'Confused by blcok definition'
+                            ) from ex
+
+                        obj_block.word_count = obj_block.count_words()
+                        obj_block.clean_fields(exclude=('content_type',))
+
+                    with transaction.atomic():
+                        save_blocks(BlockModel, created, updated, moved)
+                        save_snapshots(snapshots)
+
+                        if existing:
+                            obj_blocks.filter(
+                                pk__in=[
+                                    obj_block.pk
+                                    for obj_block in existing.values()
+                                ]
+                            ).delete()
+
+                            Snapshot.objects.filter(
+                                notion_id__in=existing.keys()
+                            ).delete()
+
+                        if has_field('notion_last_edited'):
+                            obj.notion_last_edited = edited
+
+                            if unresolved:
+                                obj.notion_last_edited = None
+
+                            Model.objects.filter(pk=obj.pk).update(
+                                notion_last_edited=obj.notion_last_edited
+                            )
 
-                if obj_blocks_field is None:
                     object_synced.send(
                         Model,
                         instance=obj,
                         direction='down'
                     )
 
-                    continue
+                lease.check()
+
+                if pages is None:
+                    progress.incr('pages_seen', len(batch))
+                    progress.incr('pages_written', len(changed))
+                    progress.incr('api_calls', limiter.requests - calls)
+                    calls = limiter.requests
+
+                    database.cursor = cursor or ''
+                    database.save(update_fields=('cursor',))
+
+            objects_synced.send(Model, direction='down')
+
+            lease.check()
+
+            if not filtered and has_field('notion_generation'):
+                delete_objects(
+                    Model.objects.filter(notion_generation__lt=generation)
+                )
+
+            if pages is None:
+                database.last_edited = last_edited
+                database.synced = started
+                database.cursor = ''
+
+                if not filtered:
+                    database.swept = started
+
+                database.save()
+                progress.finish()
+
+            return Model.objects.filter(notion_generation=generation)
+        finally:
+            lease.release()
+
+
+def rebuild(
+    Model, before_clean=None, blocks_field=None, media_handler='',
+    concurrency=None
+):
+    links = LinkIndex()
+    links.load()
+
+    try:
+        obj_blocks_field = Model._meta.get_field(blocks_field)
+    except FieldDoesNotExist:
+        obj_blocks_field = None
+
+    if connection.vendor == 'sqlite':
+        concurrency = 1
+
+    def rebuild_object(pk):
+        try:
+            obj = Model.objects.get(pk=pk)
+            snapshot = Snapshot.objects.filter(notion_id=obj.notion_id).first()
+
+            if snapshot is not None:
+                result = snapshot.get_definition()
+                relations = RelationResolver()
+                values = {}
+                after = {}
 
-                obj_blocks = getattr(obj, obj_blocks_field.name)
-                block_ids = []
+                for attrs in result['properties'].values():
+                    relations.add(attrs)
 
-                for i, (block_id, block) in enumerate(
-                    get_blocks(result, obj).items()
+                for field, value in schema.to_python(
+                    result['properties'],
+                    handle_relation=relations.get
                 ):
-                    obj_block = obj_blocks.filter(
-                        notion_id=block_id
-                    ).first() or BlockModel(
-                        **{
-                            blocks_parent: obj
-                        },
-                        notion_id=block_id,
-                        content_type=content_type,
-                        object_id=obj.pk
+                    if isinstance(field, RelatedField):
+                        after[field.name] = (field, value)
+                    else:
+                        values[field.name] = value
+
+                with transaction.atomic():
+                    obj = Model.objects.select_for_update().get(pk=pk)
+
+                    for fname, value in values.items():
+                        setattr(obj, fname, value)
+
+                    if callable(before_clean):
+                        before_clean(obj, result)
+
+                    obj.full_clean()
+                    obj.save()
+                    set_relations(obj, after)
+
+            if obj_blocks_field is not None:
+                kwargs = {
+                    'handle_link': links.get
+                }
+
+                if media_handler:
+                    handler = getattr(obj, media_handler)
+                    kwargs['handle_media'] = lambda url: handler(
+                        url,
+                        download=defer_download
                     )
 
-                    obj_block.type = block.type
-                    obj_block.ordering = i
+                obj_blocks = list(getattr(obj, obj_blocks_field.name).all())
+                definitions = {
+                    snapshot.notion_id: snapshot.get_definition()
+                    for snapshot in Snapshot.objects.filter(
+                        notion_id__in=[
+                            obj_block.notion_id
+                            for obj_block in obj_blocks
+                        ]
+                    )
+                }
 
-                    try:
-                        obj_block.properties = block.to_python()
-                    except Exception as ex:
-                        print(json.dumps(block._definition, indent=4))
-                        raise Exception('Confused by blcok definition') from ex
+                rebuilt = []
+                for obj_block in obj_blocks:
+                    if definition := definitions.get(obj_block.notion_id):
+                        block = Block(definition, **kwargs)
 
-                    obj_block.full_clean()
-                    obj_block.save()
-                    block_ids.append(obj_block.pk)
+                        try:
+                            obj_block.properties = block.to_python()
+                        except DownloadDeferred:
+                            continue
 
-                obj_blocks.exclude(pk__in=block_ids).delete()
-                object_synced.send(
-                    Model,
-                    instance=obj,
-                    direction='down'
+                        obj_block.word_count = obj_block.count_words()
+                        rebuilt.append(obj_block)
+
+                obj_blocks_field.related_model.objects.bulk_update(
+                    rebuilt,
+                    ('properties', 'word_count'),
+                    batch_size=PAGE_SIZE
                 )
 
+            object_synced.send(
+                Model,
+                instance=obj,
+                direction='down'
+            )
+        finally:
+            connection.close()
+
+    for dbname, dbid in settings.DATABASES.items():
+        if not issubclass(apps.get_model(dbname), Model):
+            continue
+
+        database, created = Database.objects.get_or_create(
+            notion_id=dbid,
+            defaults={
+                'name': dbname
+            }
+        )
+
+        schema = get_schema(Model, database)
+        queryset = Model.objects.exclude(notion_id=None).order_by('pk')
+        last_pk = 0
+
+        with ThreadPoolExecutor(
+            concurrency or settings.CONCURRENCY
+        ) as executor:
+            while pks := list(
+                queryset.filter(
+                    pk__gt=last_pk
+                ).values_list(
+                    'pk',
+                    flat=True
+                )[:PAGE_SIZE]
+            ):
+                list(executor.map(rebuild_object, pks))
+                last_pk = pks[-1]
+
         objects_synced.send(Model, direction='down')
-        Model.objects.exclude(pk__in=pks).delete()
-        return Model.objects.filter(pk__in=pks)
+
+        return Model.objects.exclude(notion_id=None)
 
 
 def from_model(obj):
@@ -212,25 +823,13 @@ def from_model(obj):
         if not isinstance(obj, Model):
             continue
 
-        notion = Client(auth=settings.API_KEY)
-        response = notion.databases.retrieve(dbid)
-        attrs = {}
-
-        for name, definition in response['properties'].items():
-            prop = Property(name, definition)
-            field_name = name.replace(' ', '_').lower()
-
-            try:
-                dbfield = Model._meta.get_field(field_name)
-            except FieldDoesNotExist:
-                continue
-
-            value = getattr(obj, dbfield.name)
-            if isinstance(dbfield, RelatedField):
-                value = value.all()    
-
-            if value is not None:
-                attrs[definition['id']] = prop.from_python(value)
+        notion = get_client()
+        database, created = Database.objects.get_or_create(
+            notion_id=dbid,
+            defaults={
+                'name': dbname
+            }
+        )
 
         object_synced.send(
             Model,
@@ -243,19 +842,26 @@ def from_model(obj):
             direction='up'
         )
 
-        if obj.notion_id:
-            notion.pages.update(
-                str(obj.notion_id),
-                properties=attrs
-            )
+        for refresh in (False, True):
+            attrs = get_schema(Model, database, refresh).from_python(obj)
 
-            return obj.notion_id
-        else:
-            doc = notion.pages.create(
-                parent={
-                    'database_id': dbid
-                },
-                properties=attrs
-            )
+            try:
+                if obj.notion_id:
+                    notion.pages.update(
+                        str(obj.notion_id),
+                        properties=attrs
+                    )
 
-        return doc['id']
+                    return obj.notion_id
+
+                doc = notion.pages.create(
+                    parent={
+                        'database_id': dbid
+                    },
+                    properties=attrs
+                )
+            except APIResponseError as ex:
+                if refresh or ex.code != APIErrorCode.ValidationError:
+                    raise
+            else:
+                return doc['id']
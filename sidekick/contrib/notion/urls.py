@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import WebhookView
+
+
+urlpatterns = (
+    path('webhook/', WebhookView.as_view(), name='notion_webhook'),
+)
@@ -0,0 +1,51 @@
+from django.http.response import HttpResponseForbidden, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic import View
+from hashlib import sha256
+from . import settings
+from .jobs import sync_page
+import hmac
+import json
+import logging
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class WebhookView(View):
+    def is_signed(self):
+        if not settings.WEBHOOK_SECRET:
+            return False
+
+        signature = 'sha256=%s' % hmac.new(
+            settings.WEBHOOK_SECRET.encode('utf-8'),
+            self.request.body,
+            sha256
+        ).hexdigest()
+
+        return hmac.compare_digest(
+            signature,
+            self.request.headers.get('X-Notion-Signature', '')
+        )
+
+    def post(self, request):
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+        if not settings.WEBHOOK_SECRET and 'verification_token' in payload:
+            logging.warning(
+                'Notion webhook verification token: %s',
+                payload['verification_token']
+            )
+
+            return JsonResponse({})
+
+        if not self.is_signed():
+            return HttpResponseForbidden()
+
+        entity = payload.get('entity') or {}
+        if entity.get('type') == 'page' and entity.get('id'):
+            sync_page.delay(entity['id'])
+
+        return JsonResponse({})
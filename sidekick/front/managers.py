@@ -4,7 +4,7 @@ from sidekick.contrib.notion import sync as notion_sync
 
 
 class PageManager(Manager):
-    def sync(self):
+    def sync(self, **kwargs):
         def clean(obj, doc):
             if not obj.slug:
                 obj.slug = slugify(obj.title)
@@ -16,5 +16,6 @@ class PageManager(Manager):
             self.model,
             before_clean=clean,
             blocks_field='content',
-            media_handler='attach'
+            media_handler='attach',
+            **kwargs
         )
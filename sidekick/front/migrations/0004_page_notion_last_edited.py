@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('front', '0003_page_main_menu'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='notion_last_edited',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Notion last edited'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('front', '0004_page_notion_last_edited'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='notion_generation',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -2,7 +2,7 @@ from django import forms
 from django.db import transaction
 from django.db.models import Count
 from django.utils import timezone
-from sidekick.contrib.notion import sync
+from sidekick.contrib.notion.outbox import push
 from taggit.models import Tag
 from .models import Subscriber
 
@@ -83,9 +83,7 @@ class SubscriberForm(forms.ModelForm):
             )
 
             obj.save()
-            transaction.on_commit(
-                lambda: sync.from_model(obj)
-            )
+            push(obj)
 
             return obj
 
@@ -9,7 +9,7 @@ import jwt
 
 
 class PostManager(Manager):
-    def sync(self):
+    def sync(self, **kwargs):
         def clean(obj, doc):
             if not obj.slug:
                 obj.slug = slugify(obj.title)
@@ -21,7 +21,8 @@ class PostManager(Manager):
             self.model,
             before_clean=clean,
             blocks_field='content',
-            media_handler='attach'
+            media_handler='attach',
+            **kwargs
         )
 
 
@@ -61,11 +62,12 @@ class SubscriberManager(Manager):
             'Please confirm your intention to subscribe.'
         )
 
-    def sync(self):
+    def sync(self, **kwargs):
         def clean(obj, doc):
             obj.subscribed = doc['created_time']
 
         return notion_sync.to_model(
             self.model,
-            before_clean=clean
+            before_clean=clean,
+            **kwargs
         )
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0005_alter_attachment_notion_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='notion_last_edited',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Notion last edited'),
+        ),
+        migrations.AddField(
+            model_name='subscriber',
+            name='notion_last_edited',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Notion last edited'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0006_post_notion_last_edited_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='notion_generation',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='subscriber',
+            name='notion_generation',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
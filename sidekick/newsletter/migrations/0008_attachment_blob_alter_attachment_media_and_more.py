@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:47
+
+import django.db.models.deletion
+import sidekick.newsletter.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0007_post_notion_generation_subscriber_notion_generation'),
+        ('notion', '0009_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='post_attachments', to='notion.blob'),
+        ),
+        migrations.AlterField(
+            model_name='attachment',
+            name='media',
+            field=models.FileField(blank=True, max_length=255, upload_to=sidekick.newsletter.models.Attachment.upload_media),
+        ),
+        migrations.AlterField(
+            model_name='attachment',
+            name='notion_url',
+            field=models.URLField(db_index=True, max_length=512, verbose_name='Notion URL'),
+        ),
+    ]
@@ -1,8 +1,8 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.files import File
-from django.core.files.storage import default_storage
 from django.db import models
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
@@ -10,18 +10,16 @@ from django.utils.html import strip_tags
 from hashlib import md5
 from markdown import markdown
 from readtime import of_markdown as markdown_readtime
-from sidekick.contrib.notion import sync
-from sidekick.contrib.notion.models import Block
+from sidekick.contrib.notion.media import attach, download, release
+from sidekick.contrib.notion.models import Blob, Block
+from sidekick.contrib.notion.outbox import push
 from sidekick.contrib.notion.signals import object_synced
 from sidekick.helpers import create_og_image
 from sidekick.mail import render_to_inbox
 from taggit.managers import TaggableManager
-from tempfile import NamedTemporaryFile
-from urllib.parse import urlsplit
 from .managers import PostManager, SubscriberManager
 import jwt
 import os
-import requests
 
 
 class Post(models.Model):
@@ -47,6 +45,15 @@ class Post(models.Model):
         editable=False
     )
 
+    notion_last_edited = models.DateTimeField(
+        'Notion last edited',
+        null=True,
+        blank=True,
+        editable=False
+    )
+
+    notion_generation = models.PositiveIntegerField(default=0, editable=False)
+
     author = models.ForeignKey(
         'auth.User',
         related_name='newsletter_posts',
@@ -80,40 +87,8 @@ class Post(models.Model):
     def get_absolute_url(self):
         return reverse('post_detail', args=(self.slug,))
 
-    def attach(self, url):
-        scheme, domain, path, query, fragment = urlsplit(url)
-        baseurl = '%s://%s%s' % (scheme, domain, path)
-        media = 'newsletter/%s/%s' % (
-            self.pk,
-            baseurl.split('/')[-1]
-        )
-
-        if default_storage.exists(media):
-            return media
-
-        for attachment in self.attachments.filter(
-            notion_url=baseurl
-        ):
-            if default_storage.exists(attachment.media.name):
-                return attachment.media.name
-
-            attachment.delete()
-
-        response = requests.get(url)
-        response.raise_for_status()
-
-        with NamedTemporaryFile(
-            suffix=os.path.splitext(path)[-1]
-        ) as temp:
-            temp.write(response.content)
-            temp.seek(0)
-
-            attachment = self.attachments.create(
-                notion_url=baseurl,
-                media=File(temp)
-            )
-
-            return attachment.media.name
+    def attach(self, url, download=download):
+        return attach(self.attachments, url, download=download)
 
     def get_excerpt(self):
         if self.subtitle:
@@ -160,8 +135,20 @@ class Attachment(models.Model):
         related_name='attachments'
     )
 
-    notion_url = models.URLField('Notion URL', max_length=512, unique=True)
-    media = models.FileField(max_length=255, upload_to=upload_media)
+    notion_url = models.URLField('Notion URL', max_length=512, db_index=True)
+    blob = models.ForeignKey(
+        Blob,
+        on_delete=models.PROTECT,
+        related_name='post_attachments',
+        null=True,
+        blank=True
+    )
+
+    media = models.FileField(
+        max_length=255,
+        upload_to=upload_media,
+        blank=True
+    )
     tags = TaggableManager(
         blank=True,
         related_name='post_attachments'
@@ -182,6 +169,15 @@ class Subscriber(models.Model):
         editable=False
     )
 
+    notion_last_edited = models.DateTimeField(
+        'Notion last edited',
+        null=True,
+        blank=True,
+        editable=False
+    )
+
+    notion_generation = models.PositiveIntegerField(default=0, editable=False)
+
     email = models.EmailField(max_length=255, unique=True)
     name = models.CharField(max_length=100, null=True, blank=True)
     subscribed = models.DateTimeField()
@@ -269,7 +265,7 @@ class Subscriber(models.Model):
         )
 
         self.sent_posts.add(*posts)
-        sync.from_model(self)
+        push(self)
 
     class Meta:
         ordering = ('-subscribed',)
@@ -294,3 +290,9 @@ def post_synced(sender, instance, direction, **kwargs):
     )
 
     instance.save()
+
+
+@receiver(post_delete, sender=Attachment)
+def attachment_deleted(sender, instance, **kwargs):
+    if instance.blob_id:
+        release(instance.blob_id)
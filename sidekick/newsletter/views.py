@@ -18,6 +18,7 @@ from django.views.generic import (
 from easy_thumbnails.files import get_thumbnailer
 from hashlib import md5
 from sidekick.contrib.notion import sync
+from sidekick.contrib.notion.outbox import push
 from sidekick.seo.views import (
     SEOMixin,
     OpenGraphMixin,
@@ -245,8 +246,12 @@ class ConfirmSubscriberView(View):
         )
 
         obj.excluded_tags.add(*excluded_tags)
-        obj.notion_id = sync.from_model(obj)
-        obj.save()
+
+        if obj.notion_id:
+            push(obj)
+        else:
+            obj.notion_id = sync.from_model(obj)
+            obj.save()
 
         return obj
 
@@ -359,7 +364,7 @@ class UnsubscribeView(SEOMixin, View):
         if request.method == 'GET':
             obj.status = 'Unsubscribed'
             obj.save()
-            sync.from_model(obj)
+            push(obj)
 
         return HttpResponseRedirect(
             self.get_success_url()
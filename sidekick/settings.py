@@ -121,11 +121,23 @@ RQ_QUEUES = {
 
 NOTION = {
     'API_KEY': os.getenv('NOTION_API_KEY'),
+    'WEBHOOK_SECRET': os.getenv('NOTION_WEBHOOK_SECRET'),
     'DATABASES': {
         'newsletter.Post': os.getenv('NOTION_NEWSLETTER_DATABASE'),
         'newsletter.Subscriber': os.getenv('NOTION_SUBSCRIBER_DATABASE'),
         'front.Page': os.getenv('NOTION_PAGE_DATABASE')
-    }
+    },
+    'INTERVALS': {
+        'front.Page': (60 * 15, 60 * 60 * 24)
+    },
+    'EXPORT_MODELS': (
+        'taggit.Tag',
+        'newsletter.Post',
+        'newsletter.Attachment',
+        'front.Page',
+        'front.Attachment',
+        'taggit.TaggedItem'
+    )
 }
 
 ANYMAIL = {
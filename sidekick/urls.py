@@ -28,6 +28,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('robots.txt', RobotsTxtView.as_view(), name='robots_txt'),
     path('webmention/', include('webmention.urls')),
+    path('notion/', include('sidekick.contrib.notion.urls')),
     path('', include('sidekick.newsletter.urls')),
     path('', include(sitemaps)),
     path('~/ready/', ReadyView.as_view())